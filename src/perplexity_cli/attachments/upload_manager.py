@@ -30,6 +30,7 @@ from perplexity_cli.utils.exceptions import (
 from perplexity_cli.utils.http_errors import raise_http_status_error
 from perplexity_cli.utils.http_headers import build_perplexity_headers
 from perplexity_cli.utils.logging import get_logger, redact_path, redact_response_text
+from perplexity_cli.utils.retry import get_backoff_delay
 from perplexity_cli.utils.upstream_contracts import parse_upload_url_response, require_mapping
 
 RequestException: type[Exception] = Exception
@@ -66,6 +67,9 @@ if TYPE_CHECKING:
 logger: logging.Logger = get_logger()
 _S3_UPLOAD_SUCCESS_STATUS: Final = 204
 MAX_CONCURRENT_UPLOADS: Final = 4
+_S3_RETRYABLE_STATUSES: Final = frozenset({429, 500, 502, 503, 504})
+_S3_MAX_ATTEMPTS: Final = 3
+_S3_MAX_BACKOFF_SECONDS: Final = 10.0
 
 
 class UploadMetadataEntry(TypedDict):
@@ -139,6 +143,15 @@ def _load_response_json(response: _UploadUrlResponse) -> object:
     return response.json()
 
 
+def _decoded_size(encoded: str) -> int:
+    """Return the byte length of base64 ``encoded`` without decoding it.
+
+    ``FileAttachment`` validates ``data`` as padded base64, so every four
+    characters carry three bytes, less one per trailing ``=``.
+    """
+    return len(encoded) // 4 * 3 - encoded[-2:].count("=")
+
+
 def _get_httpx_async_client_factory() -> type[httpx.AsyncClient]:
     """Return the async HTTP client factory used for S3 uploads."""
     return httpx.AsyncClient
@@ -311,6 +324,15 @@ def _validate_upload_uuid_bijection(requested_uuids: set[str], returned_uuids: s
     raise UpstreamSchemaError(msg)
 
 
+async def _sleep_before_s3_retry(attempt: int) -> None:
+    """Back off before re-sending a throttled or failed S3 upload.
+
+    Args:
+        attempt: The zero-indexed attempt that just failed.
+    """
+    await asyncio.sleep(get_backoff_delay(attempt, max_delay=_S3_MAX_BACKOFF_SECONDS))
+
+
 async def _cancel_and_drain(tasks: list[asyncio.Task[Any]]) -> None:
     """Cancel unfinished tasks and drain them to completion.
 
@@ -332,6 +354,8 @@ class AttachmentUploader:
     3. Return final S3 URLs for use in queries
     """
 
+    __slots__ = ("base_url", "cookies", "token")
+
     def __init__(
         self,
         token: str,
@@ -529,7 +553,7 @@ class AttachmentUploader:
 
         for attachment in attachments:
             file_uuid = str(uuid.uuid4())
-            decoded_size = len(base64.b64decode(attachment.data))
+            decoded_size = _decoded_size(attachment.data)
             files_metadata[file_uuid] = {
                 "filename": attachment.filename,
                 "content_type": attachment.content_type,
@@ -585,47 +609,99 @@ class AttachmentUploader:
         """
         logger.info("Uploading file: %s", redact_path(attachment.filename))
 
-        form_data = self._build_s3_form_data(upload_data)
         file_content = base64.b64decode(attachment.data)
+        multipart = self._build_s3_multipart(upload_data, attachment, file_content)
 
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("S3 upload form fields: %s", list(form_data.keys()))
+            logger.debug("S3 upload form fields: %s", list(multipart)[:-1])
             logger.debug("File size: %s bytes", len(file_content))
 
-        response = await self._execute_s3_upload(client, form_data, attachment, file_content)
+        response = await self._execute_s3_upload_with_retry(client, multipart, attachment)
         return self._handle_s3_response(response, upload_data, attachment)
 
     @staticmethod
-    def _build_s3_form_data(upload_data: Mapping[str, object]) -> dict[str, str]:
-        """Build the form data dictionary for an S3 presigned upload.
+    def _build_s3_multipart(
+        upload_data: Mapping[str, object], attachment: FileAttachment, file_content: bytes
+    ) -> dict[str, MultipartFormValue]:
+        """Build the multipart payload for an S3 presigned upload.
+
+        The signing fields and the file part are assembled in one pass, with
+        the file last as S3 requires, so retries re-send the same payload
+        without rebuilding it.
 
         Args:
             upload_data: Presigned URL data from the API.
+            attachment: The FileAttachment being uploaded.
+            file_content: The attachment's decoded file bytes.
 
         Returns:
-            Dictionary of form fields for the multipart upload.
+            Ordered mapping of multipart form parts, ending with ``file``.
 
         Raises:
             UpstreamSchemaError: If the presigned fields or object URL are malformed.
         """
         fields = _require_upload_fields(upload_data)
         _validate_s3_object_url(upload_data)
-        return {key: str(value) for key, value in fields.items() if key != "file"}
+        multipart: dict[str, MultipartFormValue] = {
+            key: (None, str(value)) for key, value in fields.items() if key != "file"
+        }
+        multipart["file"] = (
+            attachment.filename,
+            file_content,
+            attachment.content_type,
+        )
+        return multipart
+
+    @classmethod
+    async def _execute_s3_upload_with_retry(
+        cls,
+        client: httpx.AsyncClient,
+        multipart: dict[str, MultipartFormValue],
+        attachment: FileAttachment,
+    ) -> httpx.Response:
+        """Execute the S3 upload, retrying transient throttling and server errors.
+
+        S3 answers 429 and 5xx (notably 503 SlowDown) for requests that are
+        expected to succeed on a later attempt, so those statuses are retried
+        with exponential backoff up to ``_S3_MAX_ATTEMPTS`` times.  Any other
+        status is returned immediately, as is the final attempt's response.
+
+        Args:
+            client: The shared HTTP client for this upload batch.
+            multipart: Prebuilt multipart form parts for the upload.
+            attachment: The FileAttachment being uploaded.
+
+        Returns:
+            The httpx Response from the last attempt.
+
+        Raises:
+            AttachmentUploadError: If the upload request fails.
+        """
+        for attempt in range(_S3_MAX_ATTEMPTS - 1):
+            response = await cls._execute_s3_upload(client, multipart, attachment)
+            if response.status_code not in _S3_RETRYABLE_STATUSES:
+                return response
+            logger.warning(
+                "S3 upload returned status %s, retrying (attempt %s/%s)",
+                response.status_code,
+                attempt + 1,
+                _S3_MAX_ATTEMPTS,
+            )
+            await _sleep_before_s3_retry(attempt)
+        return await cls._execute_s3_upload(client, multipart, attachment)
 
     @staticmethod
     async def _execute_s3_upload(
         client: httpx.AsyncClient,
-        form_data: dict[str, str],
+        multipart: dict[str, MultipartFormValue],
         attachment: FileAttachment,
-        file_content: bytes,
     ) -> httpx.Response:
         """Execute the multipart upload to S3.
 
         Args:
             client: The shared HTTP client for this upload batch.
-            form_data: Form fields for the presigned upload.
+            multipart: Prebuilt multipart form parts for the upload.
             attachment: The FileAttachment being uploaded.
-            file_content: Decoded file content bytes.
 
         Returns:
             The httpx Response object.
@@ -633,14 +709,9 @@ class AttachmentUploader:
         Raises:
             AttachmentUploadError: If the upload request fails.
         """
-        files_dict: dict[str, MultipartFormValue] = {}
-        for key, value in form_data.items():
-            files_dict[key] = (None, value)
-        files_dict["file"] = (attachment.filename, file_content, attachment.content_type)
-
         try:
             s3_bucket_url: str = get_s3_bucket_url()
-            return await client.post(s3_bucket_url, files=files_dict)
+            return await client.post(s3_bucket_url, files=multipart)
         except Exception as e:
             logger.exception("S3 upload error: %s", e)
             msg = f"Failed to upload {attachment.filename} to S3: {e}"
@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime
-from typing import Final, cast
+from typing import ClassVar, Final, cast
 
 from perplexity_cli.utils.atomic_write import atomic_write_json
 from perplexity_cli.utils.config import get_config_paths, get_save_cookies_enabled
 from perplexity_cli.utils.encryption import decrypt_token, encrypt_token
 from perplexity_cli.utils.exceptions import AuthenticationError
-from perplexity_cli.utils.file_permissions import verify_secure_permissions
+from perplexity_cli.utils.file_permissions import verify_secure_mode
 from perplexity_cli.utils.logging import get_logger, redact_mapping_keys, redact_path
 
 TOKEN_AGE_WARNING_DAYS = 30
@@ -18,6 +19,9 @@ _MALFORMED_COOKIES_ERROR = "Token file contains malformed cookies data"
 _TOKEN_FORMAT_VERSION: Final[int] = 2
 _DEFAULT_TOKEN_VERSION = 1
 
+type _DecryptedCacheKey = tuple[str, str, str | None, int]
+type _DecryptedToken = tuple[str, dict[str, str] | None]
+
 
 def _extract_created_at(record: dict[str, object]) -> str | None:
     """Return the ``created_at`` field if it is a string, else None."""
@@ -56,6 +60,11 @@ class TokenManager:
     # File permissions: owner read/write only (0600)
     SECURE_PERMISSIONS = 0o600
 
+    # Decrypted (token, cookies) keyed by token path and the encrypted record
+    # fields. Every save writes fresh random salts, so a changed file can never
+    # hit a stale entry; repeat loads in one process skip the PBKDF2 work.
+    _decrypted: ClassVar[dict[_DecryptedCacheKey, _DecryptedToken]] = {}
+
     def __init__(self) -> None:
         """Initialise the token manager."""
         self.token_path = get_config_paths().token_path
@@ -82,6 +91,7 @@ class TokenManager:
             encrypted_token = encrypt_token(token)
             token_record = self._prepare_token_data(encrypted_token, cookies)
             atomic_write_json(self.token_path, token_record, mode=self.SECURE_PERMISSIONS)
+            TokenManager._decrypted.clear()
 
             saved_cookies = "cookies" in token_record
             cookie_count = len(cookies) if cookies else 0
@@ -144,17 +154,13 @@ class TokenManager:
             IOError: If the token exists but cannot be read.
             RuntimeError: If token file has insecure permissions or decryption fails.
         """
-        if not self.token_path.exists():
-            return (None, None)
-
-        self._verify_permissions()
-
         try:
             token_record = self._read_and_validate_token_file()
+            if token_record is None:
+                return (None, None)
             self._check_token_age(_extract_created_at(token_record))
 
-            token = decrypt_token(_extract_token_string(token_record))
-            cookies = self._decrypt_cookies(token_record, _extract_version(token_record))
+            token, cookies = self._decrypt_record(token_record)
 
             cookie_count = len(cookies) if cookies else 0
             # owner: security - arguments are a redacted path and cookie count, never values.
@@ -171,17 +177,28 @@ class TokenManager:
             msg = f"Failed to load token from {self.token_path}: {e}"
             raise OSError(msg) from e
 
-    def _read_and_validate_token_file(self) -> dict[str, object]:
+    def _read_and_validate_token_file(self) -> dict[str, object] | None:
         """Read and validate the token file structure.
 
+        The file is opened once: permissions are checked with ``fstat`` on
+        the open descriptor and the contents are read from the same handle,
+        so there is no separate existence or permission ``stat``.
+
         Returns:
-            The parsed and validated token data dictionary.
+            The parsed and validated token data dictionary, or None if the
+            token file does not exist.
 
         Raises:
-            AuthenticationError: If the file is not encrypted or missing token data.
+            AuthenticationError: If the file has insecure permissions, is not
+                encrypted or is missing token data.
         """
-        with open(self.token_path, encoding="utf-8") as f:
-            token_record: dict[str, object] = json.load(f)
+        try:
+            token_file = self.token_path.open("rb")
+        except FileNotFoundError:
+            return None
+        with token_file:
+            self._verify_permissions(os.fstat(token_file.fileno()))
+            token_record: dict[str, object] = json.loads(token_file.read())
 
         if not token_record.get("encrypted"):
             self.logger.warning("Token file is not encrypted")
@@ -219,14 +236,35 @@ class TokenManager:
         except (ValueError, TypeError):
             self.logger.debug("Could not parse token creation timestamp")
 
-    def _decrypt_cookies(
-        self, token_record: dict[str, object], version: int
-    ) -> dict[str, str] | None:
-        """Decrypt and validate cookies from the token data.
+    def _decrypt_record(self, token_record: dict[str, object]) -> _DecryptedToken:
+        """Decrypt the token and cookies of a record, reusing earlier results.
 
         Args:
-            token_record: The parsed token file data.
-            version: The token file format version.
+            token_record: The parsed and validated token file data.
+
+        Returns:
+            Tuple of (token, cookies); the cookies dict is a fresh copy.
+        """
+        encrypted_token = _extract_token_string(token_record)
+        version = _extract_version(token_record)
+        # Extracted (and logged) on every load; malformed values become None.
+        encrypted_cookies = self._extract_encrypted_cookies(token_record, version)
+        key = (str(self.token_path), encrypted_token, encrypted_cookies, version)
+        cached = self._decrypted.get(key)
+        if cached is None:
+            cached = (decrypt_token(encrypted_token), self._decrypt_cookies(encrypted_cookies))
+            self._decrypted[key] = cached
+        token, cookies = cached
+        if cookies is None:
+            return token, None
+        self._log_cookie_details(cookies)
+        return token, dict(cookies)
+
+    def _decrypt_cookies(self, encrypted_cookies: str | None) -> dict[str, str] | None:
+        """Decrypt and validate the encrypted cookies string of a token record.
+
+        Args:
+            encrypted_cookies: The encrypted cookies string, or None if absent.
 
         Returns:
             Dictionary of cookies, or None if not available.
@@ -234,13 +272,9 @@ class TokenManager:
         Raises:
             AuthenticationError: If cookie data is malformed.
         """
-        encrypted_cookies = self._extract_encrypted_cookies(token_record, version)
         if encrypted_cookies is None:
             return None
-
-        cookies = self._parse_and_validate_cookies(decrypt_token(encrypted_cookies))
-        self._log_cookie_details(cookies)
-        return cookies
+        return self._parse_and_validate_cookies(decrypt_token(encrypted_cookies))
 
     def _extract_encrypted_cookies(
         self, token_record: dict[str, object], version: int
@@ -334,6 +368,7 @@ class TokenManager:
         if self.token_path.exists():
             try:
                 self.token_path.unlink()
+                TokenManager._decrypted.clear()
                 # Audit log: token cleared
                 # owner: security - the only argument is the redacted token-file path.
                 self.logger.info(  # nosemgrep: custom.credential-logging-vendored,python.lang.security.audit.logging.logger-credential-leak.python-logger-credential-disclosure  # owner: auth-team; reason: token redacted before logging
@@ -352,14 +387,18 @@ class TokenManager:
         """
         return self.token_path.exists()
 
-    def _verify_permissions(self) -> None:
+    def _verify_permissions(self, file_stat: os.stat_result | None = None) -> None:
         """Verify that token file has secure permissions (0600).
 
+        Args:
+            file_stat: ``stat`` result for the already-open token file; the
+                path is stat'ed when omitted.
+
         Raises:
             RuntimeError: If file permissions are not 0600.
         """
-        verify_secure_permissions(
-            self.token_path,
+        verify_secure_mode(
+            file_stat or self.token_path.stat(),
             expected_permissions=self.SECURE_PERMISSIONS,
             file_type="token",
             logger=self.logger,
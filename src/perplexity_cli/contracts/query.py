@@ -8,17 +8,36 @@ standalone contracts package without creating a dependency cycle.
 
 from __future__ import annotations
 
+import re
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     model_validator,
 )
 
 from perplexity_cli.utils.upstream_contracts import require_mapping
 
+_CITATION_RE = re.compile(r"\[\d+\]")
+
+
+def strip_citation_markers(text: str) -> str:
+    """Remove numeric citation markers such as ``[1]`` from ``text``.
+
+    Args:
+        text: Answer text possibly containing citation markers.
+
+    Returns:
+        The text with every ``[n]`` marker removed.
+    """
+    if "[" not in text:
+        return text
+    return _CITATION_RE.sub("", text)
+
+
 # ---------------------------------------------------------------------------
 # Lightweight parameter objects (dataclasses, not Pydantic)
 # ---------------------------------------------------------------------------
@@ -92,8 +111,13 @@ class WebResult(BaseModel):
     pre-validator enforces that the input is a mapping (raising
     ``UpstreamSchemaError`` otherwise) so that malformed upstream data
     is caught early with a domain-specific exception.
+
+    Instances are frozen: results are never mutated after parsing, and
+    immutability makes them hashable and safe to share between formatters.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(default="")
     url: str = Field(default="")
     snippet: str | None = Field(default=None)
@@ -107,7 +131,17 @@ class WebResult(BaseModel):
 
 
 class Answer(BaseModel):
-    """Complete answer with text and references."""
+    """Complete answer with text and references.
+
+    Frozen so fields cannot be reassigned once the answer has been assembled
+    from the stream. The ``references`` list keeps instances unhashable.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     text: str
     references: list[WebResult] = Field(default_factory=_new_references)
+
+    def text_without_citations(self) -> str:
+        """Return the answer text with citation markers removed."""
+        return strip_citation_markers(self.text)
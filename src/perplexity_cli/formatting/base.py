@@ -6,8 +6,41 @@ import os
 import re
 import sys
 from abc import ABC, abstractmethod
+from typing import ClassVar, Final
 
-from perplexity_cli.contracts.query import Answer, WebResult
+from perplexity_cli.contracts.query import Answer, WebResult, strip_citation_markers
+
+# One anchored alternation so each line costs a single regex match instead of
+# one call per structural kind.
+_STRUCTURAL_LINE_RE = re.compile(
+    r"(?P<header>#{1,6}\s)"
+    r"|(?P<bullet>[-*+]\s)"
+    r"|(?P<numbered>\d+\.\s)"
+    r"|(?P<quote_or_table>[>|])"
+    r"|(?P<rule>[*\-]{3,}$)"
+)
+# Every structural line starts with one of these characters or a decimal
+# digit, which lets ordinary prose lines skip the regex entirely.
+_STRUCTURAL_PREFIXES = ("#", "-", "*", "+", ">", "|")
+
+# Bound on memoised ``format_complete`` outputs kept per formatter instance.
+_COMPLETE_CACHE_SIZE: Final[int] = 32
+
+type _CompleteCacheKey = tuple[str, tuple[tuple[str, str, str | None], ...], bool]
+
+
+def _complete_cache_key(answer: Answer, strip_references: bool) -> _CompleteCacheKey:
+    """Build a hashable key describing everything ``format_complete`` reads.
+
+    Args:
+        answer: The answer being formatted.
+        strip_references: Whether references are being stripped.
+
+    Returns:
+        Tuple of the answer text, reference fields, and the strip flag.
+    """
+    references = tuple((ref.name, ref.url, ref.snippet) for ref in answer.references)
+    return answer.text, references, strip_references
 
 
 def _is_structural_line(stripped: str) -> bool:
@@ -22,141 +55,151 @@ def _is_structural_line(stripped: str) -> bool:
     Returns:
         True if the line is a structural element.
     """
-    return bool(
-        re.match(r"^#{1,6}\s", stripped)
-        or re.match(r"^[-*+]\s", stripped)
-        or re.match(r"^\d+\.\s", stripped)
-        or re.match(r"^[>\|]", stripped)
-        or re.match(r"^[\*\-]{3,}$", stripped)
-    )
+    if not stripped.startswith(_STRUCTURAL_PREFIXES) and not stripped[:1].isdecimal():
+        return False
+    return _STRUCTURAL_LINE_RE.match(stripped) is not None
+
+
+# How many leading lines ``is_structured_markdown`` samples, and the share of
+# non-blank sampled lines that must be structural for text to count as such.
+_MARKDOWN_SAMPLE_LINES: Final[int] = 20
+_MARKDOWN_STRUCTURE_RATIO: Final[float] = 0.5
 
 
-def _is_continuation_line(next_line: str, next_stripped: str) -> bool:
-    """Check whether a line is an indented continuation of a structural block.
+def is_structured_markdown(text: str) -> bool:
+    """Check whether text is dominated by Markdown structure.
+
+    Only the first ``_MARKDOWN_SAMPLE_LINES`` lines are inspected, so the
+    cost is bounded regardless of answer length.
 
     Args:
-        next_line: The raw line including leading whitespace.
-        next_stripped: The line with leading whitespace removed.
+        text: The answer text.
 
     Returns:
-        True if the line should be joined to the preceding structural line.
+        True if most sampled non-blank lines are structural elements or
+        code fences.
     """
-    if next_line == next_stripped or not next_stripped:
-        return False
-    if next_stripped.startswith("```"):
+    head = text.split("\n", _MARKDOWN_SAMPLE_LINES)[:_MARKDOWN_SAMPLE_LINES]
+    sample = list(filter(None, (line.lstrip() for line in head)))
+    if not sample:
         return False
-    return not _is_structural_line(next_stripped)
+    structural = sum(map(_is_block_marker, sample))
+    return structural / len(sample) > _MARKDOWN_STRUCTURE_RATIO
 
 
-def _is_prose_boundary(next_line: str, next_stripped: str) -> bool:
-    """Check whether a line marks the end of a prose paragraph.
+def _is_block_marker(stripped: str) -> bool:
+    """Check whether a stripped line is a code fence or structural element."""
+    return stripped.startswith("```") or _is_structural_line(stripped)
 
-    Args:
-        next_line: The raw line including whitespace.
-        next_stripped: The line with leading whitespace removed.
 
-    Returns:
-        True if the line should terminate prose collection.
-    """
-    if not next_line.strip() or next_stripped.startswith("```"):
-        return True
-    return _is_structural_line(next_stripped)
+# (open paragraph's line fragments or None, open paragraph is structural,
+# inside code fence). Fragments are joined with spaces once, on flush, so a
+# long paragraph is not re-copied for every continuation line.
+type _UnwrapState = tuple[list[str] | None, bool, bool]
+_UNWRAP_START: _UnwrapState = (None, False, False)
 
 
-def _collect_code_block(lines: list[str], i: int, result: list[str]) -> int:
-    """Collect a fenced code block verbatim into result.
+def _continuation(line: str, stripped: str, structural: bool, breaks: bool) -> str | None:
+    """Return the text ``line`` contributes when it continues an open paragraph.
+
+    Structural blocks only absorb indented lines; prose absorbs any
+    non-blank line that does not start a new block.
 
     Args:
-        lines: All source lines.
-        i: Index of the opening fence line.
-        result: Accumulator list for output lines.
+        line: The raw line including leading whitespace.
+        stripped: The line with leading whitespace removed.
+        structural: Whether the open paragraph is a structural element.
+        breaks: Whether the line starts a code fence or structural element.
 
     Returns:
-        The index immediately after the closing fence.
+        The text to join with a space, or None if the paragraph ends here.
     """
-    result.append(lines[i])
-    i += 1
-    while i < len(lines):
-        result.append(lines[i])
-        if lines[i].lstrip().startswith("```"):
-            return i + 1
-        i += 1
-    return i
+    if breaks or not stripped:
+        return None
+    if not structural:
+        return stripped.rstrip()
+    return stripped if line != stripped else None
 
 
-def _collect_structural_block(lines: list[str], i: int, result: list[str]) -> int:
-    """Collect a structural line and its indented continuations.
+def _open_block(line: str, stripped: str, structural: bool, result: list[str]) -> _UnwrapState:
+    """Start the block that ``line`` begins.
 
     Args:
-        lines: All source lines.
-        i: Index of the structural line.
+        line: The raw line including leading whitespace.
+        stripped: The line with leading whitespace removed.
+        structural: Whether the line is a structural element.
         result: Accumulator list for output lines.
 
     Returns:
-        The index of the next unprocessed line.
+        The unwrap state after the line.
     """
-    paragraph = lines[i]
-    i += 1
-    while i < len(lines):
-        next_line = lines[i]
-        next_stripped = next_line.lstrip()
-        if not _is_continuation_line(next_line, next_stripped):
-            break
-        paragraph += " " + next_stripped
-        i += 1
-    result.append(paragraph)
-    return i
-
-
-def _collect_prose_paragraph(lines: list[str], i: int, result: list[str]) -> int:
-    """Collect regular prose lines into a single joined paragraph.
+    if stripped.startswith("```"):
+        result.append(line)
+        return None, False, True
+    if not stripped:
+        result.append("")
+        return _UNWRAP_START
+    return [line], structural, False
+
+
+def _unwrap_text_line(
+    line: str, stripped: str, result: list[str], state: _UnwrapState
+) -> _UnwrapState:
+    """Extend the open paragraph with ``line`` or close it and open a new block.
 
     Args:
-        lines: All source lines.
-        i: Index of the first prose line.
+        line: The raw line including leading whitespace.
+        stripped: The line with leading whitespace removed.
         result: Accumulator list for output lines.
+        state: The unwrap state before the line (outside a code fence).
 
     Returns:
-        The index of the next unprocessed line.
+        The unwrap state after the line.
     """
-    paragraph = lines[i]
-    i += 1
-    while i < len(lines):
-        next_line = lines[i]
-        next_stripped = next_line.lstrip()
-        if _is_prose_boundary(next_line, next_stripped):
-            break
-        paragraph += " " + next_line.strip()
-        i += 1
-    result.append(paragraph)
-    return i
-
-
-def _dispatch_line(lines: list[str], i: int, result: list[str]) -> int:
-    """Route a single line to the appropriate collector.
+    paragraph, paragraph_structural, _ = state
+    structural = _is_structural_line(stripped)
+    if paragraph is not None:
+        breaks = structural or stripped.startswith("```")
+        tail = _continuation(line, stripped, paragraph_structural, breaks)
+        if tail is not None:
+            paragraph.append(tail)
+            return state
+        result.append(" ".join(paragraph))
+    return _open_block(line, stripped, structural, result)
+
+
+def _unwrap_line(line: str, result: list[str], state: _UnwrapState) -> _UnwrapState:
+    """Consume one source line in the single-pass paragraph unwrapper.
+
+    Each line is stripped and classified exactly once: fenced code is
+    copied verbatim, and everything else either extends the open paragraph
+    or closes it and starts a new block.
 
     Args:
-        lines: All source lines.
-        i: Index of the current line.
+        line: The raw line without its trailing newline.
         result: Accumulator list for output lines.
+        state: The unwrap state before the line.
 
     Returns:
-        The index of the next unprocessed line.
+        The unwrap state after the line.
     """
-    line = lines[i]
-    if line.lstrip().startswith("```"):
-        return _collect_code_block(lines, i, result)
-    if not line.strip():
-        result.append("")
-        return i + 1
-    if _is_structural_line(line.lstrip()):
-        return _collect_structural_block(lines, i, result)
-    return _collect_prose_paragraph(lines, i, result)
+    stripped = line.lstrip()
+    if state[2]:
+        result.append(line)
+        return None, False, not stripped.startswith("```")
+    return _unwrap_text_line(line, stripped, result, state)
 
 
 class Formatter(ABC):
     """Abstract base class for output formatters."""
 
+    #: Text placed between the answer and references in ``format_complete``.
+    section_separator: ClassVar[str] = "\n"
+
+    def __init__(self) -> None:
+        """Initialise the per-instance ``format_complete`` cache."""
+        self._complete_cache: dict[_CompleteCacheKey, str] = {}
+
     @staticmethod
     def strip_citations(text: str) -> str:
         """Remove citation references from text.
@@ -169,7 +212,22 @@ class Formatter(ABC):
         Returns:
             Text with citation numbers removed.
         """
-        return re.sub(r"\[\d+\]", "", text)
+        return strip_citation_markers(text)
+
+    @staticmethod
+    def answer_source_text(answer: Answer, strip_references: bool) -> str:
+        """Select the answer text to format, honouring ``strip_references``.
+
+        Args:
+            answer: The answer being formatted.
+            strip_references: If True, use the text without citation markers.
+
+        Returns:
+            ``Answer.text_without_citations()`` or the raw text.
+        """
+        if strip_references:
+            return answer.text_without_citations()
+        return answer.text
 
     @staticmethod
     def unwrap_paragraph_lines(text: str) -> str:
@@ -187,16 +245,16 @@ class Formatter(ABC):
         Returns:
             Text with continuation lines joined, structural elements intact.
         """
-        if not text:
-            return ""
+        if "\n" not in text:
+            # A single line has nothing to join; only a blank one is normalised.
+            return "" if text.isspace() else text
 
-        lines = text.split("\n")
         result: list[str] = []
-        i = 0
-
-        while i < len(lines):
-            i = _dispatch_line(lines, i, result)
-
+        state = _UNWRAP_START
+        for line in text.split("\n"):
+            state = _unwrap_line(line, result, state)
+        if state[0] is not None:
+            result.append(" ".join(state[0]))
         return "\n".join(result)
 
     @abstractmethod
@@ -225,6 +283,9 @@ class Formatter(ABC):
     def format_complete(self, answer: Answer, strip_references: bool = False) -> str:
         """Format complete answer with references.
 
+        Output is memoised per formatter on the answer's content, so
+        rendering the same answer again is a dictionary lookup.
+
         Args:
             answer: Answer object containing text and references.
             strip_references: If True, exclude references section from output.
@@ -232,11 +293,28 @@ class Formatter(ABC):
         Returns:
             Complete formatted output.
         """
-        output_parts: list[str] = []
+        cache = self._complete_cache
+        key = _complete_cache_key(answer, strip_references)
+        formatted = cache.get(key)
+        if formatted is None:
+            formatted = self._format_complete(answer, strip_references)
+            if len(cache) >= _COMPLETE_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = formatted
+        return formatted
+
+    def _format_complete(self, answer: Answer, strip_references: bool) -> str:
+        """Build the complete output for ``format_complete``.
+
+        Args:
+            answer: Answer object containing text and references.
+            strip_references: If True, exclude references section from output.
 
-        # Add formatted answer
-        formatted_answer = self.format_answer(answer.text, strip_references=strip_references)
-        output_parts.append(formatted_answer)
+        Returns:
+            Complete formatted output.
+        """
+        text = self.answer_source_text(answer, strip_references)
+        output_parts = [self.format_answer(text)]
 
         # Add formatted references if present (and not stripped)
         if answer.references and not strip_references:
@@ -244,7 +322,7 @@ class Formatter(ABC):
             if formatted_refs:
                 output_parts.append(formatted_refs)
 
-        return "\n".join(output_parts)
+        return self.section_separator.join(output_parts)
 
     def render_complete(self, answer: Answer, strip_references: bool = False) -> None:
         """Render complete output directly.
@@ -46,7 +46,7 @@ class JSONFormatter(Formatter):
         _ = references
         return ""
 
-    def format_complete(self, answer: Answer, strip_references: bool = False) -> str:
+    def _format_complete(self, answer: Answer, strip_references: bool) -> str:
         """Format complete answer as JSON.
 
         Args:
@@ -56,7 +56,8 @@ class JSONFormatter(Formatter):
         Returns:
             Complete JSON formatted output.
         """
-        answer_text = self.format_answer(answer.text, strip_references=strip_references)
+        text = self.answer_source_text(answer, strip_references)
+        answer_text = self.format_answer(text)
 
         references: list[dict[str, Any]] = []
         if answer.references and not strip_references:
@@ -80,4 +81,6 @@ class JSONFormatter(Formatter):
             "meta": None,
             "next_actions": [],
         }
-        return json.dumps(output, indent=2, ensure_ascii=False)
+        # The payload is freshly built from plain str/int/None values, so it
+        # cannot contain reference cycles and the encoder's check is skipped.
+        return json.dumps(output, indent=2, ensure_ascii=False, check_circular=False)
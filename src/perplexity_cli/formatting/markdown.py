@@ -4,15 +4,29 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from perplexity_cli.formatting.base import Formatter
+from perplexity_cli.formatting.base import Formatter, is_structured_markdown
 
 if TYPE_CHECKING:
-    from perplexity_cli.contracts.query import Answer, WebResult
+    from perplexity_cli.contracts.query import WebResult
 
 
 class MarkdownFormatter(Formatter):
     """Formatter that outputs GitHub-flavoured Markdown."""
 
+    # Blank line between the answer and the references section.
+    section_separator = "\n\n"
+
+    def __init__(self, preserve_markdown: bool = False) -> None:
+        """Initialise the Markdown formatter.
+
+        Args:
+            preserve_markdown: If True, skip paragraph unwrapping for answers
+                that are already mostly structured Markdown, keeping their
+                original line breaks.
+        """
+        super().__init__()
+        self.preserve_markdown = preserve_markdown
+
     def format_answer(self, text: str, strip_references: bool = False) -> str:
         """Format answer as Markdown section.
 
@@ -28,7 +42,8 @@ class MarkdownFormatter(Formatter):
             text = self.strip_citations(text)
 
         # Unwrap artificial line breaks from the API response
-        text = self.unwrap_paragraph_lines(text)
+        if not (self.preserve_markdown and is_structured_markdown(text)):
+            text = self.unwrap_paragraph_lines(text)
 
         return text.rstrip()
 
@@ -44,39 +59,27 @@ class MarkdownFormatter(Formatter):
         if not references:
             return ""
 
-        lines = ["## References"]
-        for i, ref in enumerate(references, 1):
-            # Format: [number]. [Name](URL) - "Snippet"
-            snippet_text = f' - "{self._escape_markdown(ref.snippet)}"' if ref.snippet else ""
-            escaped_url = self._escape_markdown(ref.url)
-            escaped_name = self._escape_markdown(ref.name)
-            lines.append(f"{i}. [{escaped_name}]({escaped_url}){snippet_text}")
+        return "\n".join(
+            [
+                "## References",
+                *(self._format_reference(i, ref) for i, ref in enumerate(references, 1)),
+            ]
+        )
 
-        return "\n".join(lines)
-
-    def format_complete(self, answer: Answer, strip_references: bool = False) -> str:
-        """Format complete answer with Markdown structure.
+    def _format_reference(self, index: int, ref: WebResult) -> str:
+        """Format a single reference as a numbered Markdown list item.
 
         Args:
-            answer: Answer object with text and references.
-            strip_references: If True, exclude references section from output.
+            index: One-based position of the reference.
+            ref: The web result to format.
 
         Returns:
-            Complete Markdown document.
+            Line of the form ``[number]. [Name](URL) - "Snippet"``.
         """
-        lines: list[str] = []
-
-        # Answer section
-        formatted_answer = self.format_answer(answer.text, strip_references=strip_references)
-        lines.append(formatted_answer)
-
-        # References section (only if not stripped)
-        if answer.references and not strip_references:
-            lines.append("")
-            formatted_refs = self.format_references(answer.references)
-            lines.append(formatted_refs)
-
-        return "\n".join(lines)
+        snippet_text = f' - "{self._escape_markdown(ref.snippet)}"' if ref.snippet else ""
+        escaped_url = self._escape_markdown(ref.url)
+        escaped_name = self._escape_markdown(ref.name)
+        return f"{index}. [{escaped_name}]({escaped_url}){snippet_text}"
 
     @staticmethod
     def _escape_markdown(text: str) -> str:
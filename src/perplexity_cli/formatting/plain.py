@@ -8,10 +8,16 @@ from typing import TYPE_CHECKING
 from perplexity_cli.formatting.base import Formatter
 
 if TYPE_CHECKING:
-    from perplexity_cli.contracts.query import Answer, WebResult
+    from perplexity_cli.contracts.query import WebResult
 
 
 _MAX_CONSECUTIVE_BLANK_LINES = 2
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.+?)\*")
+_HEADER_RE = re.compile(r"^(#{1,6})\s+(\S.*)$")
+_HORIZONTAL_RULE_RE = re.compile(r"^[\*\-]{3,}$")
+# Ruler above the section (at least 30 characters) plus an underlined title.
+_REFERENCES_HEADER = "\n".join(["─" * 50, "References", "=" * len("References")])
 
 
 def _strip_markdown_emphasis(text: str) -> str:
@@ -23,8 +29,10 @@ def _strip_markdown_emphasis(text: str) -> str:
     Returns:
         Text with bold/italic markers removed.
     """
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    return re.sub(r"\*(.+?)\*", r"\1", text)
+    if "*" not in text:
+        return text
+    text = _BOLD_RE.sub(r"\1", text)
+    return _ITALIC_RE.sub(r"\1", text)
 
 
 def _process_header(line: str, result: list[str]) -> tuple[bool, int]:
@@ -38,7 +46,7 @@ def _process_header(line: str, result: list[str]) -> tuple[bool, int]:
         A tuple of (was_header, blank_count). If the line was a header,
         was_header is True and blank_count is reset to 0.
     """
-    header_match = re.match(r"^(#{1,6})\s+(\S.*)$", line)
+    header_match = _HEADER_RE.match(line)
     if not header_match:
         return False, 0
     content = _strip_markdown_emphasis(header_match.group(2))
@@ -89,7 +97,7 @@ def _process_plain_line(
     Returns:
         Updated (skip_next_blank, blank_count) state.
     """
-    if re.match(r"^[\*\-]{3,}$", line.strip()):
+    if _HORIZONTAL_RULE_RE.match(line.strip()):
         return skip_next_blank, blank_count
 
     was_header, blank_count_new = _process_header(line, result)
@@ -106,6 +114,9 @@ def _process_plain_line(
 class PlainTextFormatter(Formatter):
     """Formatter that outputs plain text without any formatting."""
 
+    # Blank line between the answer and the references section.
+    section_separator = "\n\n"
+
     def format_answer(self, text: str, strip_references: bool = False) -> str:
         """Format answer text as plain text with underlined headers.
 
@@ -135,32 +146,6 @@ class PlainTextFormatter(Formatter):
 
         return "\n".join(result).rstrip()
 
-    def format_complete(self, answer: Answer, strip_references: bool = False) -> str:
-        """Format complete answer with references.
-
-        Args:
-            answer: Answer object containing text and references.
-            strip_references: If True, exclude references section from output.
-
-        Returns:
-            Complete formatted output with proper spacing.
-        """
-        output_parts: list[str] = []
-
-        # Add formatted answer
-        formatted_answer = self.format_answer(answer.text, strip_references=strip_references)
-        output_parts.append(formatted_answer)
-
-        # Add formatted references if present (and not stripped)
-        if answer.references and not strip_references:
-            # Add blank line before references section
-            output_parts.append("")
-            formatted_refs = self.format_references(answer.references)
-            if formatted_refs:
-                output_parts.append(formatted_refs)
-
-        return "\n".join(output_parts)
-
     def format_references(self, references: list[WebResult]) -> str:
         """Format references as a simple numbered list with underlined header.
 
@@ -173,14 +158,9 @@ class PlainTextFormatter(Formatter):
         if not references:
             return ""
 
-        lines: list[str] = []
-        # Add ruler above references (at least 30 characters)
-        lines.append("─" * 50)
-        # Add References header with underline
-        lines.append("References")
-        lines.append("=" * len("References"))
-        # Add references
-        for i, ref in enumerate(references, 1):
-            lines.append(f"[{i}] {ref.url}")
-
-        return "\n".join(lines)
+        return "\n".join(
+            [
+                _REFERENCES_HEADER,
+                *(f"[{i}] {ref.url}" for i, ref in enumerate(references, 1)),
+            ]
+        )
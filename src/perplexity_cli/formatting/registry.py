@@ -11,11 +11,18 @@ if TYPE_CHECKING:
 
 
 class FormatterRegistry:
-    """Registry for formatter classes."""
+    """Registry for formatter classes.
+
+    Each registered class is instantiated at most once and the instance is
+    reused by every subsequent lookup. Sharing is safe because a formatter's
+    caches are keyed on the full call input, and apart from those cache
+    entries nothing on the instance changes between calls.
+    """
 
     def __init__(self) -> None:
         """Initialise the registry."""
         self._formatters: dict[str, type[Formatter]] = {}
+        self._instances: dict[str, Formatter] = {}
 
     def register(self, name: str, formatter_class: type[Formatter]) -> None:
         """Register a formatter.
@@ -25,6 +32,7 @@ class FormatterRegistry:
             formatter_class: The formatter class.
         """
         self._formatters[name] = formatter_class
+        self._instances.pop(name, None)
 
     def get(self, name: str) -> Formatter:
         """Get a formatter instance by name.
@@ -33,16 +41,21 @@ class FormatterRegistry:
             name: The formatter name.
 
         Returns:
-            An instance of the formatter.
+            The shared instance of the formatter.
 
         Raises:
             ValueError: If the formatter name is not found.
         """
+        formatter = self._instances.get(name)
+        if formatter is not None:
+            return formatter
         if name not in self._formatters:
             available = ", ".join(self.names())
             msg = f"Unknown formatter: {name}. Available: {available}"
             raise ValueError(msg)
-        return self._formatters[name]()
+        formatter = self._formatters[name]()
+        self._instances[name] = formatter
+        return formatter
 
     def names(self) -> list[str]:
         """List all registered formatter names.
@@ -74,7 +87,7 @@ def get_formatter(name: str) -> Formatter:
         name: The formatter name.
 
     Returns:
-        An instance of the formatter.
+        The shared instance of the formatter.
 
     Raises:
         ValueError: If the formatter is not found.
@@ -19,6 +19,40 @@ if TYPE_CHECKING:
 
 _SECTION_HEADER_STYLE = "bold cyan"
 _HEADER_LEVEL_2: Final[int] = 2
+_HEADER_RE = re.compile(r"^(#{1,6})\s+(\S.*)$")
+_CODE_BLOCK_RE = re.compile(r"```(\w*)\n(.*?)\n```", re.DOTALL)
+
+
+def _add_reference_rows(table: Table, references: list[WebResult]) -> None:
+    """Append one ``(#, Source, URL)`` row per reference to ``table``.
+
+    Args:
+        table: Table with the three reference columns already defined.
+        references: List of web results.
+    """
+    for i, ref in enumerate(references, 1):
+        table.add_row(str(i), ref.name, ref.url)
+
+
+def _wrapped_references_table(references: list[WebResult], title: str | None = None) -> Table:
+    """Build the references table with a fixed-width index and wrapping text.
+
+    The index column is fixed at three cells and never wraps, so Rich only
+    needs to measure the Source and URL columns, which are capped in width.
+
+    Args:
+        references: List of web results.
+        title: Optional title rendered above the table.
+
+    Returns:
+        The populated table.
+    """
+    table = Table(title=title, show_header=True, header_style=_SECTION_HEADER_STYLE, padding=(0, 1))
+    table.add_column("#", style="cyan", width=3, no_wrap=True)
+    table.add_column("Source", style="white", no_wrap=False, max_width=40)
+    table.add_column("URL", style="bright_blue", no_wrap=False, max_width=120)
+    _add_reference_rows(table, references)
+    return table
 
 
 class RichFormatter(Formatter):
@@ -26,9 +60,14 @@ class RichFormatter(Formatter):
 
     def __init__(self) -> None:
         """Initialise Rich formatter."""
+        super().__init__()
         # Console for direct output to terminal with styling
         # width=200 allows long URLs to not be truncated
         self.console = Console(force_terminal=True, legacy_windows=False, width=200)
+        # Off-screen consoles reused via Console.capture() for string output;
+        # code blocks are rendered without forcing a terminal, as before.
+        self._capture_console = Console(file=StringIO(), force_terminal=True, legacy_windows=False)
+        self._code_console = Console(file=StringIO(), legacy_windows=False)
 
     def format_answer(self, text: str, strip_references: bool = False) -> str:
         """Format answer text with Rich styling.
@@ -63,23 +102,12 @@ class RichFormatter(Formatter):
         if not references:
             return ""
 
-        # Create table with text wrapping
-        table = Table(
-            title="References", show_header=True, header_style=_SECTION_HEADER_STYLE, padding=(0, 1)
-        )
-        table.add_column("#", style="cyan", width=3, no_wrap=True)
-        table.add_column("Source", style="white", no_wrap=False, max_width=40)
-        table.add_column("URL", style="bright_blue", no_wrap=False, max_width=120)
-
-        # Add rows
-        for i, ref in enumerate(references, 1):
-            table.add_row(str(i), ref.name, ref.url)
+        table = _wrapped_references_table(references, title="References")
 
         # Render table to string with ANSI codes
-        string_buffer = StringIO()
-        temp_console = Console(file=string_buffer, force_terminal=True, legacy_windows=False)
-        temp_console.print(table)
-        return string_buffer.getvalue().rstrip()
+        with self._capture_console.capture() as capture:
+            self._capture_console.print(table)
+        return capture.get().rstrip()
 
     def render_complete(self, answer: Answer, strip_references: bool = False) -> None:
         """Render complete answer directly to Rich Console.
@@ -90,9 +118,7 @@ class RichFormatter(Formatter):
         """
         # Answer section - render markdown with left alignment
         # Parse and style markdown while keeping text left-aligned
-        answer_text = answer.text
-        if strip_references:
-            answer_text = self.strip_citations(answer_text)
+        answer_text = self.answer_source_text(answer, strip_references)
         answer_text = self.unwrap_paragraph_lines(answer_text)
 
         self._print_formatted_text(answer_text)
@@ -105,19 +131,25 @@ class RichFormatter(Formatter):
             self.console.print(Text("References", style=_SECTION_HEADER_STYLE))
             self.console.print()
 
-            # Create and print references table with text wrapping
-            # Use no_wrap=True for # column, but allow wrapping for others
-            table = Table(show_header=True, header_style=_SECTION_HEADER_STYLE, padding=(0, 1))
-            table.add_column("#", style="cyan", width=3, no_wrap=True)
-            table.add_column("Source", style="white", no_wrap=False, max_width=40)
-            table.add_column("URL", style="bright_blue", no_wrap=False, max_width=120)
+            self.console.print(_wrapped_references_table(answer.references))
 
-            for i, ref in enumerate(answer.references, 1):
-                table.add_row(str(i), ref.name, ref.url)
+    def format_complete(self, answer: Answer, strip_references: bool = False) -> str:
+        """Format complete answer with Rich styling, without memoisation.
 
-            self.console.print(table)
+        The capture console has no fixed width, so the output depends on the
+        terminal width at render time and a cached string could be stale
+        after a resize.
 
-    def format_complete(self, answer: Answer, strip_references: bool = False) -> str:
+        Args:
+            answer: Answer object with text and references.
+            strip_references: If True, exclude references section from output.
+
+        Returns:
+            Complete Rich-formatted output (with ANSI codes for terminal).
+        """
+        return self._format_complete(answer, strip_references)
+
+    def _format_complete(self, answer: Answer, strip_references: bool) -> str:
         """Format complete answer with Rich styling.
 
         Args:
@@ -127,36 +159,25 @@ class RichFormatter(Formatter):
         Returns:
             Complete Rich-formatted output (with ANSI codes for terminal).
         """
-        string_buffer = StringIO()
-        # Force terminal mode to preserve ANSI colour codes
-        output_console = Console(file=string_buffer, force_terminal=True, legacy_windows=False)
-
         # Answer section
-        answer_text = answer.text
-        if strip_references:
-            answer_text = self.strip_citations(answer_text)
+        answer_text = self.answer_source_text(answer, strip_references)
 
         formatted_answer = self._process_answer_text(answer_text)
-        output_console.print(formatted_answer)
-
-        # References section (only if not stripped)
-        if answer.references and not strip_references:
-            output_console.print()
-            output_console.print("─" * 50, style="dim")
-            output_console.print()
 
-            # Create and print references table
-            table = Table(show_header=True, header_style=_SECTION_HEADER_STYLE)
-            table.add_column("#", style="cyan", width=3)
-            table.add_column("Source", style="white")
-            table.add_column("URL", style="bright_blue")
+        # Capture console is in terminal mode to preserve ANSI colour codes
+        output_console = self._capture_console
+        with output_console.capture() as capture:
+            output_console.print(formatted_answer)
 
-            for i, ref in enumerate(answer.references, 1):
-                table.add_row(str(i), ref.name, ref.url)
+            # References section (only if not stripped)
+            if answer.references and not strip_references:
+                output_console.print()
+                output_console.print("─" * 50, style="dim")
+                output_console.print()
 
-            output_console.print(table)
+                output_console.print(_wrapped_references_table(answer.references))
 
-        return string_buffer.getvalue().rstrip()
+        return capture.get().rstrip()
 
     @staticmethod
     def _header_style(level: int) -> str:
@@ -176,7 +197,7 @@ class RichFormatter(Formatter):
         lines = text.split("\n")
         for line in lines:
             # Check for headers (###, ##, #)
-            header_match = re.match(r"^(#{1,6})\s+(\S.*)$", line)
+            header_match = _HEADER_RE.match(line)
             if header_match:
                 content = header_match.group(2)
                 level = len(header_match.group(1))
@@ -198,10 +219,9 @@ class RichFormatter(Formatter):
         """
         try:
             syntax = Syntax(code_content, language, theme="monokai", line_numbers=False)
-            code_buffer = StringIO()
-            code_console = Console(file=code_buffer, legacy_windows=False)
-            code_console.print(syntax)
-            return code_buffer.getvalue().rstrip()
+            with self._code_console.capture() as capture:
+                self._code_console.print(syntax)
+            return capture.get().rstrip()
         except (ValueError, TypeError, LookupError):
             return f"```{language}\n{code_content}\n```"
 
@@ -215,10 +235,9 @@ class RichFormatter(Formatter):
             Processed text with syntax highlighting applied.
         """
         result_parts: list[str] = []
-        pattern = r"```(\w*)\n(.*?)\n```"
         last_end = 0
 
-        for match in re.finditer(pattern, text, re.DOTALL):
+        for match in _CODE_BLOCK_RE.finditer(text):
             before_text = text[last_end : match.start()]
             if before_text:
                 result_parts.append(before_text)
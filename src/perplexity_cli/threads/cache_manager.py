@@ -7,6 +7,7 @@ invalidation - only fetching fresh data when necessary.
 
 import json
 from datetime import UTC, date, datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -390,10 +391,7 @@ class ThreadCacheManager:
                 cached_urls.add(thread.url)
 
         # Sort by created_at (newest first)
-        merged.sort(
-            key=lambda t: t.created_at,
-            reverse=True,
-        )
+        merged.sort(key=attrgetter("created_at"), reverse=True)
 
         deduped_count = len(fetched_threads) - (len(merged) - len(cached_threads))
         if deduped_count > 0:
@@ -9,18 +9,21 @@ from __future__ import annotations
 
 import csv
 import io
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 
-from pydantic import BaseModel
-
 from perplexity_cli.utils.atomic_write import atomic_write_text
 
 _FORMULA_PREFIXES = ("=", "+", "-", "@")
+_CSV_HEADER = ("created_at", "title", "url")
 _CSV_MODE = 0o644
 
 
-class ThreadRecord(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ThreadRecord:
     """Data class representing a single thread record.
 
     Attributes:
@@ -41,21 +44,58 @@ def _neutralise_cell(value: str) -> str:
     return value
 
 
+def _csv_row(record: ThreadRecord) -> tuple[str, str, str]:
+    """Return a record's neutralised cells in CSV column order."""
+    return (
+        _neutralise_cell(record.created_at),
+        _neutralise_cell(record.title),
+        _neutralise_cell(record.url),
+    )
+
+
+def _render_threads_csv(records: Iterable[ThreadRecord]) -> str:
+    """Render records as CSV text with a header row and neutralised cells.
+
+    Args:
+        records: ThreadRecord objects to render, consumed once
+
+    Returns:
+        The complete CSV document
+
+    Raises:
+        ValueError: If records yields no items
+    """
+    # Peek at the first record so empty input fails before any work is done
+    remaining = iter(records)
+    first = next(remaining, None)
+    if first is None:
+        msg = "Cannot write CSV with empty records list"
+        raise ValueError(msg)
+
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(_CSV_HEADER)
+    writer.writerows(map(_csv_row, chain((first,), remaining)))
+    return buffer.getvalue()
+
+
 def write_threads_csv(
-    records: list[ThreadRecord],
+    records: Iterable[ThreadRecord],
     output_path: Path | None = None,
 ) -> Path:
     """Write thread records to CSV file.
 
     Creates a CSV file with columns: created_at, title, url
-    Records are written in the order provided (typically newest first). Every
-    record cell is checked for spreadsheet formula prefixes (``=``, ``+``,
-    ``-``, ``@`` after leading whitespace) and neutralised with an apostrophe.
+    Records are written in the order provided (typically newest first) and are
+    consumed in a single pass, so any iterable, including a generator, works.
+    Every record cell is checked for spreadsheet formula prefixes (``=``,
+    ``+``, ``-``, ``@`` after leading whitespace) and neutralised with an
+    apostrophe.
     The destination is replaced atomically; a pre-existing file is preserved
     byte-for-byte if the write fails.
 
     Args:
-        records: List of ThreadRecord objects to export
+        records: ThreadRecord objects to export, consumed once
         output_path: Optional output file path. If None, generates filename
                     as threads-YYYY-MM-DD-HHMMSS.csv in current directory
 
@@ -64,7 +104,7 @@ def write_threads_csv(
 
     Raises:
         IOError: If file cannot be written
-        ValueError: If records list is empty
+        ValueError: If records yields no items
 
     Example:
         >>> records = [
@@ -78,9 +118,8 @@ def write_threads_csv(
         >>> print(path)
         threads-2025-12-23-143022.csv
     """
-    if not records:
-        msg = "Cannot write CSV with empty records list"
-        raise ValueError(msg)
+    # Render the full CSV text before touching the filesystem
+    text = _render_threads_csv(records)
 
     # Generate default filename if not provided
     if output_path is None:
@@ -90,26 +129,9 @@ def write_threads_csv(
     # Ensure path is a Path object
     output_path = Path(output_path)
 
-    # Render the full CSV text before touching the filesystem
-    buffer = io.StringIO(newline="")
-    writer = csv.writer(buffer)
-
-    # Write header
-    writer.writerow(["created_at", "title", "url"])
-
-    # Write records
-    for record in records:
-        writer.writerow(
-            [
-                _neutralise_cell(record.created_at),
-                _neutralise_cell(record.title),
-                _neutralise_cell(record.url),
-            ]
-        )
-
     # Replace the destination atomically
     try:
-        atomic_write_text(output_path, buffer.getvalue(), _CSV_MODE)
+        atomic_write_text(output_path, text, _CSV_MODE)
     except OSError as exc:
         msg = f"Failed to write CSV file to {output_path}: {exc}"
         raise OSError(msg) from exc
@@ -8,7 +8,7 @@ for efficient repeated exports.
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
-from datetime import datetime
+from datetime import date, datetime
 from typing import (
     TYPE_CHECKING,
     Final,
@@ -357,6 +357,21 @@ def _parse_single_thread(
     ), False
 
 
+def _date_window(from_date: str | None, to_date: str | None) -> tuple[date, date]:
+    """Parse validated date bounds once into an inclusive calendar-date window.
+
+    Args:
+        from_date: Start date (YYYY-MM-DD), inclusive, or None for no bound.
+        to_date: End date (YYYY-MM-DD), inclusive, or None for no bound.
+
+    Returns:
+        Tuple of (start, end) dates, open bounds widened to date.min/date.max.
+    """
+    start = date.fromisoformat(from_date) if from_date else date.min
+    end = date.fromisoformat(to_date) if to_date else date.max
+    return start, end
+
+
 def _handle_http_error(e: PerplexityHTTPStatusError) -> None:
     """Re-raise HTTP status errors as domain-specific exceptions.
 
@@ -904,12 +919,12 @@ class ThreadScraper:
         if not from_date and not to_date:
             return threads
 
-        filtered: list[ThreadRecord] = []
-        for thread in threads:
-            # Parse ISO 8601 timestamp back to datetime
-            dt = datetime.fromisoformat(thread.created_at)
-
-            if _is_in_date_range(dt, from_date, to_date):
-                filtered.append(thread)
-
-        return filtered
+        # Bounds are parsed once; each thread is compared on its calendar date
+        # in its own offset, matching the day-start/day-end checks used while
+        # paginating.
+        start, end = _date_window(from_date, to_date)
+        return [
+            thread
+            for thread in threads
+            if start <= datetime.fromisoformat(thread.created_at).date() <= end
+        ]
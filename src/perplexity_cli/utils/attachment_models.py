@@ -6,14 +6,20 @@ import base64
 import binascii
 from pathlib import Path
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 _TEXT_PLAIN_CONTENT_TYPE = "text/plain"
 _MAX_FILENAME_LENGTH = 255
 
 
 class FileAttachment(BaseModel):
-    """File attachment for API requests."""
+    """File attachment for API requests.
+
+    Instances are frozen: fields cannot be reassigned once the attachment
+    has been loaded, so one instance can be shared across concurrent uploads.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     filename: str = Field(
         ...,
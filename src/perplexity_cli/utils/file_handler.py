@@ -1,7 +1,8 @@
 """File handling utilities for attachment support."""
 
-import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Final
 
 from perplexity_cli.utils.attachment_models import FileAttachment
 from perplexity_cli.utils.exceptions import AttachmentError
@@ -36,71 +37,132 @@ SKIPPED_FILENAME_SUFFIXES = (
     ".jks",
     ".p8",
 )
+_PATH_PREFIXES: Final[tuple[str, ...]] = ("/", "~", "./", "../")
+_LEADING_PUNCTUATION: Final[str] = "\"'([{<`"
+_TRAILING_PUNCTUATION: Final[str] = ".,;:!?\"')]}>`"
 
 
-def _extract_file_paths_from_text(text: str) -> list[Path]:
-    """Extract file paths mentioned in text.
+def _assigned_value(token: str) -> str:
+    """Return the value of a ``key=value`` token, or the token unchanged.
+
+    A ``/`` before the first ``=`` means the token is a URL or a path rather
+    than an assignment, so it is left whole.
+    """
+    key, separator, value = token.partition("=")
+    if separator and "/" not in key:
+        return value
+    return token
+
 
-    Looks for absolute paths (starting with / or drive letters for Windows).
-    Patterns matched:
-    - Unix absolute paths: /path/to/file
-    - Windows absolute paths: C:\\path\\to\\file
-    - Tilde paths: ~/path/to/file
+def _path_candidate(token: str) -> str | None:
+    """Return the file path carried by a whitespace-delimited token, if any.
+
+    The value of a ``key=value`` token is checked on its own. Surrounding
+    quotes/brackets and trailing sentence punctuation are trimmed with
+    ``str.strip`` rather than a regex, so the scan stays linear however
+    long the query is.
 
     Args:
-        text: Text that may contain file paths.
+        token: A single whitespace-delimited word from the query text.
 
     Returns:
-        List of Path objects for any paths found.
+        The trimmed path string, or None if the token is not a path with
+        a file extension.
+    """
+    candidate = _assigned_value(token).lstrip(_LEADING_PUNCTUATION)
+    candidate = candidate.rstrip(_TRAILING_PUNCTUATION)
+    if not candidate.startswith(_PATH_PREFIXES):
+        return None
+    dot = candidate.rfind(".")
+    extension = candidate[dot + 1 :]
+    if dot <= candidate.rfind("/") or not (extension.isascii() and extension.isalnum()):
+        return None
+    return candidate
+
+
+@lru_cache(maxsize=1)
+def _home_directory() -> Path:
+    """Return the current user's home directory, looked up once per process."""
+    return Path.home()
+
+
+def _expand_home(path_str: str) -> Path:
+    """Build a Path, expanding a leading ``~/`` from the cached home directory.
+
+    Other ``~user`` forms fall back to ``Path.expanduser``.
+    """
+    if path_str.startswith("~/"):
+        return _home_directory() / path_str[2:]
+    return Path(path_str).expanduser()
+
+
+def _may_contain_path(text: str) -> bool:
+    """Return True if text has the characters every inline path needs.
+
+    Each candidate carries an extension and a leading /, ~, ./ or ../, so
+    plain prose can skip tokenising altogether.
     """
-    paths: set[Path] = set()
+    return "." in text and ("/" in text or "~" in text)
 
-    # Pattern for Unix absolute paths with file extensions (/path/to/file.ext)
-    # Requires at least one dot (file extension)
-    unix_pattern = r"/[a-zA-Z0-9._\-/]+\.[a-zA-Z0-9]+"
 
-    # Pattern for tilde paths (~/path/to/file.ext)
-    tilde_pattern = r"~[a-zA-Z0-9._\-/]*\.[a-zA-Z0-9]+"
+def _extract_file_paths_from_text(text: str) -> list[Path]:
+    """Extract file paths mentioned in text.
 
-    # Find all potential paths
-    for match in re.finditer(unix_pattern, text):
-        candidate = match.group()
-        # Remove trailing punctuation that's likely from the sentence
-        candidate = candidate.rstrip(".,;:!?'\"")
-        path = Path(candidate)
-        paths.add(path)
+    The text is split on whitespace and each token is checked in a single
+    pass. Tokens matched:
+    - Unix absolute paths with a file extension: /path/to/file.ext
+    - Tilde paths with a file extension: ~/path/to/file.ext
+    - Relative paths with a file extension: ./file.ext, ../dir/file.ext
+    - Any of the above as the value of a key=value token
 
-    for match in re.finditer(tilde_pattern, text):
-        candidate = match.group()
-        candidate = candidate.rstrip(".,;:!?'\"")
-        path = Path(candidate).expanduser()
-        paths.add(path)
+    Args:
+        text: Text that may contain file paths.
 
-    return sorted(paths)
+    Returns:
+        Sorted list of unique Path objects for any paths found.
+    """
+    if not _may_contain_path(text):
+        return []
+    # Deduplicate on the raw strings so a path mentioned several times is
+    # only turned into a Path (and later stat'ed) once.
+    candidates = {c for c in map(_path_candidate, text.split()) if c is not None}
+    return [_expand_home(c) for c in sorted(candidates)]
 
 
 def _resolve_path(path: Path, files: set[Path]) -> None:
     """Resolve a single path, adding it to the file set.
 
+    The common case of an existing file costs a single ``stat``; existence
+    is only checked separately once the path is known not to be a file or
+    directory, to choose the error to raise.
+
     Args:
-        path: Path to resolve (must exist).
+        path: Path to resolve.
         files: Set to add discovered files to.
 
     Raises:
+        FileNotFoundError: If the path does not exist.
         ValueError: If the path is neither a file nor a directory.
     """
     if path.is_file():
         files.add(path.resolve())
-    elif path.is_dir():
+        return
+    if path.is_dir():
         _add_directory_files(path, files)
-    else:
-        msg = f"Not a file or directory: {path}"
-        raise ValueError(msg)
+        return
+    if not path.exists():
+        msg = f"File or directory not found: {path}"
+        raise FileNotFoundError(msg)
+    msg = f"Not a file or directory: {path}"
+    raise ValueError(msg)
 
 
 def _process_query_paths(query_args: list[str], files: set[Path]) -> None:
     """Extract and resolve file paths mentioned in query text.
 
+    The arguments are scanned together so a path repeated across several
+    of them is only resolved once.
+
     Args:
         query_args: List of query argument strings.
         files: Set to add discovered files to.
@@ -109,13 +171,9 @@ def _process_query_paths(query_args: list[str], files: set[Path]) -> None:
         FileNotFoundError: If an extracted path does not exist.
         ValueError: If a path is neither a file nor a directory.
     """
-    for arg in query_args:
-        for path in _extract_file_paths_from_text(arg):
-            if not path.exists():
-                msg = f"File or directory not found: {path}"
-                raise FileNotFoundError(msg)
-            _resolve_path(path, files)
-            logger.debug("Extracted path from query: %s", redact_path(path))
+    for path in _extract_file_paths_from_text(" ".join(query_args)):
+        _resolve_path(path, files)
+        logger.debug("Extracted path from query: %s", redact_path(path))
 
 
 def _resolve_attach_path(path_str: str, files: set[Path]) -> None:
@@ -129,11 +187,7 @@ def _resolve_attach_path(path_str: str, files: set[Path]) -> None:
         FileNotFoundError: If the path does not exist.
         ValueError: If the path is neither a file nor a directory.
     """
-    path = Path(path_str).expanduser()
-    if not path.exists():
-        msg = f"File or directory not found: {path}"
-        raise FileNotFoundError(msg)
-    _resolve_path(path, files)
+    _resolve_path(_expand_home(path_str), files)
 
 
 def _process_attach_args(attach_args: list[str] | None, files: set[Path]) -> None:
@@ -1,6 +1,7 @@
 """File permission utilities for secure file handling."""
 
 import logging
+import os
 import stat
 from pathlib import Path
 
@@ -24,7 +25,29 @@ def verify_secure_permissions(
     Raises:
         RuntimeError: If file permissions do not match expected value.
     """
-    file_stat = file_path.stat()
+    verify_secure_mode(file_path.stat(), expected_permissions, file_type, logger)
+
+
+def verify_secure_mode(
+    file_stat: os.stat_result,
+    expected_permissions: int = 0o600,
+    file_type: str = "file",
+    logger: logging.Logger | None = None,
+) -> None:
+    """Verify the permission bits of an existing ``stat`` result.
+
+    Lets callers that already hold an open descriptor check it with
+    ``os.fstat`` instead of a second path-based ``stat``.
+
+    Args:
+        file_stat: Result of ``os.stat``/``os.fstat`` for the file.
+        expected_permissions: Expected file permissions (default: 0o600).
+        file_type: Descriptive name for error messages (e.g., "token", "cache").
+        logger: Optional logger instance for logging errors.
+
+    Raises:
+        RuntimeError: If file permissions do not match expected value.
+    """
     actual_permissions = stat.S_IMODE(file_stat.st_mode)
 
     if actual_permissions != expected_permissions:
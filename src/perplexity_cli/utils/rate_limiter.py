@@ -31,6 +31,15 @@ class RateLimiter:
         response = await client.get(url)
     """
 
+    __slots__ = (
+        "_lock",
+        "_state",
+        "period_seconds",
+        "requests_per_period",
+        "total_requests",
+        "total_wait_time",
+    )
+
     def __init__(self, requests_per_period: int, period_seconds: float) -> None:
         """Initialise rate limiter.
 
@@ -1,11 +1,13 @@
 """Pydantic models for rate limiting."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RateLimiterConfig(BaseModel):
     """Configuration for token bucket rate limiter."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     requests_per_period: int = Field(..., ge=1)
     period_seconds: float = Field(..., gt=0)
 
@@ -22,6 +24,8 @@ class RateLimiterState(BaseModel):
 class RateLimiterStats(BaseModel):
     """Statistics from rate limiter."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     total_requests: int = Field(default=0, ge=0)
     total_wait_time: float = Field(default=0.0, ge=0)
     average_wait_time: float = Field(default=0.0, ge=0)
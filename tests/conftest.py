@@ -85,9 +85,13 @@ settings.register_profile(
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
-    """Create a Click CLI test runner."""
+    """Create a Click CLI test runner shared across the session.
+
+    ``CliRunner.invoke`` builds a fresh isolated environment and result for
+    every call and tests never mutate the runner, so one instance suffices.
+    """
     return CliRunner()
 
 
@@ -12,6 +12,8 @@ The boundaries covered are:
 * **token** — :class:`FakeTokenManager` for ``TokenManager``.
 * **state** — :class:`FakeCacheManager` for ``ThreadCacheManager`` and
   :class:`FakeClickContext` for Click's current-context object.
+* **thread cache** — :class:`FakeThreadCache` for the cache-manager surface
+  ``ThreadScraper`` calls (load, coverage check, merge, save).
 * **path** — :class:`FakePath` for path-like arguments that only need
   ``stat``/``exists``/``__str__``; real ``tmp_path`` files are used where
   the filesystem state itself is under test.
@@ -162,6 +164,43 @@ class FakeCacheManager:
         self.cache_path.unlink(missing_ok=True)
 
 
+@dataclass(slots=True)
+class FakeThreadCache:
+    """``ThreadCacheManager`` fake for the scraper's cache boundary.
+
+    Attributes:
+        cached: Payload returned by :meth:`load_cache`.
+        fresh_data: Tuple returned by :meth:`requires_fresh_data`.
+        merged: Threads returned by :meth:`merge_threads`.
+        saved: The thread list passed to every :meth:`save_cache` call.
+    """
+
+    cached: dict[str, object] | None = None
+    fresh_data: tuple[bool, str | None, str | None] = (True, None, None)
+    merged: list[ThreadRecord] = field(default_factory=list)
+    saved: list[list[ThreadRecord]] = field(default_factory=list)
+
+    def load_cache(self) -> dict[str, object] | None:
+        """Return the configured cache payload."""
+        return self.cached
+
+    def requires_fresh_data(
+        self, from_date: str | None, to_date: str | None
+    ) -> tuple[bool, str | None, str | None]:
+        """Return the configured freshness decision."""
+        return self.fresh_data
+
+    def save_cache(self, threads: list[ThreadRecord]) -> None:
+        """Record the threads handed to the cache."""
+        self.saved.append(threads)
+
+    def merge_threads(
+        self, cached_threads: list[ThreadRecord], fetched_threads: list[ThreadRecord]
+    ) -> list[ThreadRecord]:
+        """Return the configured merge result."""
+        return self.merged
+
+
 @dataclass(slots=True)
 class FakeThreadScraper:
     """Async ``ThreadScraper`` fake for the export runner boundary.
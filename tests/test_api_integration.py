@@ -16,6 +16,16 @@ from perplexity_cli.api.endpoints import PerplexityAPI
 from perplexity_cli.api.models import Answer, QueryInput
 
 
+def _live_api() -> PerplexityAPI:
+    """Build a PerplexityAPI from the stored token, skipping when there is none."""
+    from perplexity_cli.auth.token_manager import TokenManager
+
+    token, cookies = TokenManager().load_token()
+    if not token:
+        pytest.skip("No token found. Run: python tests/save_auth_token.py")
+    return PerplexityAPI(token=token, cookies=cookies)
+
+
 @pytest.mark.real_api
 @pytest.mark.slow
 @pytest.mark.skipif(
@@ -28,15 +38,7 @@ class TestPerplexityAPIIntegration:
     @pytest.fixture
     def api(self) -> PerplexityAPI:
         """Create PerplexityAPI instance with real token and cookies."""
-        from perplexity_cli.auth.token_manager import TokenManager
-
-        tm = TokenManager()
-        token, cookies = tm.load_token()
-
-        if not token:
-            pytest.skip("No token found. Run: python tests/save_auth_token.py")
-
-        return PerplexityAPI(token=token, cookies=cookies)
+        return _live_api()
 
     def test_submit_query_returns_messages(self, api: PerplexityAPI) -> None:
         """Test that submit_query returns SSE messages."""
@@ -114,15 +116,7 @@ class TestAPIErrorHandling:
 
     def test_empty_query_handling(self) -> None:
         """Test handling of empty query."""
-        from perplexity_cli.auth.token_manager import TokenManager
-
-        tm = TokenManager()
-        token, cookies = tm.load_token()
-
-        if not token:
-            pytest.skip("No token found")
-
-        api = PerplexityAPI(token=token, cookies=cookies)
+        api = _live_api()
 
         with pytest.raises(ValueError, match="Query must not be empty"):
             api.get_complete_answer("")
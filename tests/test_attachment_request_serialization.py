@@ -87,9 +87,9 @@ def uploader_with_fake_transport(monkeypatch: pytest.MonkeyPatch) -> AttachmentU
     """
     uploader = AttachmentUploader(token="test-token")
     monkeypatch.setattr(
-        uploader,
+        AttachmentUploader,
         "_create_async_session",
-        lambda timeout=None: FakeHttpTransport(),
+        staticmethod(lambda timeout=None: FakeHttpTransport()),
     )
 
     async def fake_request(
@@ -81,6 +81,16 @@ class TestFileAttachmentValidation:
                 data="not-valid-base64!!!",
             )
 
+    def test_attachment_is_frozen(self) -> None:
+        """Fields cannot be reassigned after construction."""
+        attachment = FileAttachment(
+            filename="test.txt",
+            content_type="text/plain",
+            data=_encoded(b"test"),
+        )
+        with pytest.raises(ValidationError, match="frozen"):
+            attachment.data = _encoded(b"other")
+
 
 class TestFileAttachmentFromFile:
     """FileAttachment.from_file behaviour."""
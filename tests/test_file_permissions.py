@@ -7,7 +7,10 @@ from unittest.mock import MagicMock
 import pytest
 
 from perplexity_cli.utils.exceptions import AuthenticationError, ConfigurationError
-from perplexity_cli.utils.file_permissions import verify_secure_permissions
+from perplexity_cli.utils.file_permissions import (
+    verify_secure_mode,
+    verify_secure_permissions,
+)
 
 
 class TestVerifySecurePermissions:
@@ -58,3 +61,19 @@ class TestVerifySecurePermissions:
         f = tmp_path / "nonexistent.txt"
         with pytest.raises((FileNotFoundError, OSError)):
             verify_secure_permissions(f)
+
+
+class TestVerifySecureMode:
+    """Tests for verify_secure_mode on an existing stat result."""
+
+    def test_fstat_of_open_file_checked(self, tmp_path):
+        """Test that the mode from fstat on an open descriptor is verified."""
+        f = tmp_path / "token.json"
+        f.write_text("{}")
+        os.chmod(f, 0o644)
+        with f.open("rb") as handle:
+            file_stat = os.fstat(handle.fileno())
+        with pytest.raises(AuthenticationError):
+            verify_secure_mode(file_stat, file_type="token")
+        os.chmod(f, 0o600)
+        verify_secure_mode(f.stat())
@@ -5,7 +5,7 @@ import json
 import pytest
 
 from perplexity_cli.api.models import Answer, WebResult
-from perplexity_cli.formatting import get_formatter, list_formatters
+from perplexity_cli.formatting import FormatterRegistry, get_formatter, list_formatters
 from perplexity_cli.formatting.json import JSONFormatter
 from perplexity_cli.formatting.markdown import MarkdownFormatter
 from perplexity_cli.formatting.plain import PlainTextFormatter
@@ -144,6 +144,16 @@ class TestRichFormatter:
         assert "Answer text" in result
         assert "Test" in result or result.count("https://test.com") >= 1
 
+    def test_format_complete_caps_source_column(self, monkeypatch):
+        """The references table in string output wraps long source names."""
+        monkeypatch.setenv("COLUMNS", "200")
+        formatter = RichFormatter()
+        long_name = " ".join(["Source"] * 10)
+        refs = [WebResult(name=long_name, url="https://test.com")]
+        result = formatter.format_complete(Answer(text="Answer text", references=refs))
+        assert "Source Source" in result
+        assert long_name not in result
+
     def test_code_block_handling(self):
         """Test that code blocks are detected and handled."""
         formatter = RichFormatter()
@@ -178,6 +188,19 @@ class TestFormatterRegistry:
         with pytest.raises(ValueError):
             get_formatter("invalid")
 
+    def test_get_formatter_reuses_instance(self):
+        """Test repeated lookups return the same formatter instance."""
+        assert get_formatter("rich") is get_formatter("rich")
+
+    def test_register_replaces_cached_instance(self):
+        """Test re-registering a name drops the previously cached instance."""
+        registry = FormatterRegistry()
+        registry.register("plain", PlainTextFormatter)
+        first = registry.get("plain")
+        registry.register("plain", MarkdownFormatter)
+        assert isinstance(registry.get("plain"), MarkdownFormatter)
+        assert registry.get("plain") is not first
+
 
 class TestStripReferences:
     """Test strip_references functionality across all formatters."""
@@ -192,6 +215,15 @@ class TestStripReferences:
         assert "[3]" not in result
         assert "This is answer text with citations and more." in result
 
+    def test_strip_citations_without_brackets_returns_input(self):
+        """Test that citation-free text is returned as the same object."""
+        text = "No citations here, just prose."
+        assert PlainTextFormatter.strip_citations(text) is text
+
+    def test_strip_citations_keeps_non_numeric_brackets(self):
+        """Test that only numeric markers are removed."""
+        assert PlainTextFormatter.strip_citations("See [docs][2] here") == "See [docs] here"
+
     def test_plain_formatter_keeps_citations_by_default(self):
         """Test that plain formatter keeps citations by default."""
         formatter = PlainTextFormatter()
@@ -353,6 +385,11 @@ class TestUnwrapParagraphLines:
         text = "A single line of text."
         assert formatter.unwrap_paragraph_lines(text) == text
 
+    def test_single_blank_line_becomes_empty(self):
+        """Test that a lone whitespace-only line is normalised to empty."""
+        formatter = PlainTextFormatter()
+        assert formatter.unwrap_paragraph_lines("   \t") == ""
+
     def test_complex_mixed_content(self):
         """Test mixed content with code blocks, lists, headers, and prose."""
         formatter = PlainTextFormatter()
@@ -434,6 +471,18 @@ class TestUnwrapParagraphLines:
         # Should be a single line
         assert result.count("\n") == 0
 
+    def test_markdown_formatter_preserves_structured_markdown(self):
+        """Test that preserve_markdown keeps line breaks in structured answers."""
+        formatter = MarkdownFormatter(preserve_markdown=True)
+        text = "## Steps\n- first item\n  wrapped detail\n- second item"
+        assert formatter.format_answer(text) == text
+
+    def test_markdown_formatter_preserve_still_unwraps_prose(self):
+        """Test that preserve_markdown does not affect prose-dominated answers."""
+        formatter = MarkdownFormatter(preserve_markdown=True)
+        text = "A sentence that was\nwrapped by the API.\n\n- one item"
+        assert formatter.format_answer(text).startswith("A sentence that was wrapped by the API.")
+
     def test_rich_formatter_uses_unwrap(self):
         """Test that RichFormatter.format_answer unwraps lines."""
         formatter = RichFormatter()
@@ -599,3 +648,61 @@ class TestJSONEnvelopeFormat:
         answer = Answer(text="Answer[1]", references=refs)
         parsed = json.loads(formatter.format_complete(answer, strip_references=True))
         assert parsed["result"]["references"] == []
+
+
+class TestFormatCompleteCache:
+    """Test memoisation of format_complete output."""
+
+    def test_repeated_answer_is_served_from_cache(self, mocker):
+        """Rendering an equal answer twice formats it only once."""
+        formatter = PlainTextFormatter()
+        spy = mocker.spy(formatter, "format_answer")
+        refs = [WebResult(name="Src", url="https://src.com", snippet="s")]
+
+        first = formatter.format_complete(Answer(text="Answer[1]", references=refs))
+        second = formatter.format_complete(Answer(text="Answer[1]", references=refs))
+
+        assert first == second
+        assert spy.call_count == 1
+
+    def test_strip_flag_and_content_are_part_of_the_key(self):
+        """Different flags or reference content produce distinct outputs."""
+        formatter = PlainTextFormatter()
+        answer = Answer(text="Answer[1]", references=[WebResult(name="A", url="https://a.com")])
+
+        with_refs = formatter.format_complete(answer)
+        stripped = formatter.format_complete(answer, strip_references=True)
+        changed = formatter.format_complete(
+            Answer(text="Answer[1]", references=[WebResult(name="A", url="https://b.com")])
+        )
+
+        assert "a.com" in with_refs
+        assert "a.com" not in stripped
+        assert "b.com" in changed
+
+    def test_cache_is_bounded(self, mocker):
+        """The cache keeps the 32 newest answers and evicts the oldest."""
+        formatter = JSONFormatter()
+        spy = mocker.spy(formatter, "_format_complete")
+        answers = [Answer(text=f"Answer {i}") for i in range(33)]
+        for answer in answers:
+            formatter.format_complete(answer)
+
+        formatter.format_complete(answers[-1])
+        assert spy.call_count == 33
+        formatter.format_complete(answers[0])
+        assert spy.call_count == 34
+
+    def test_rich_output_follows_terminal_width(self, monkeypatch):
+        """Rich output is not memoised, so a resize is reflected on re-render."""
+        # Rich pins the width at construction when COLUMNS is already set.
+        monkeypatch.delenv("COLUMNS", raising=False)
+        formatter = RichFormatter()
+        answer = Answer(text=" ".join(["word"] * 40))
+
+        monkeypatch.setenv("COLUMNS", "40")
+        narrow = formatter.format_complete(answer)
+        monkeypatch.setenv("COLUMNS", "200")
+        wide = formatter.format_complete(answer)
+
+        assert narrow.count("\n") > wide.count("\n")
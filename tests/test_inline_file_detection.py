@@ -8,6 +8,7 @@ from pathlib import Path
 
 import pytest
 
+from perplexity_cli.utils import file_handler
 from perplexity_cli.utils.file_handler import resolve_file_arguments
 
 
@@ -281,3 +282,82 @@ class TestInlineFileDetection:
         names = [p.name for p in result]
         assert names == sorted(names)
         assert names == ["a_file.txt", "m_file.txt", "z_file.txt"]
+
+    def test_file_wrapped_in_brackets_and_quotes(self, tmp_path):
+        """Test surrounding brackets and quotes are trimmed from inline paths."""
+        test_file = tmp_path / "wrapped.md"
+        test_file.write_text("Wrapped")
+
+        for query in (f"see ({test_file})", f'open "{test_file}"', f"read [{test_file}]."):
+            result = resolve_file_arguments([query])
+            assert [p.name for p in result] == ["wrapped.md"], f"Failed for query: {query}"
+
+    def test_url_and_embedded_slash_not_detected(self):
+        """Test URLs and words containing a slash are not treated as file paths."""
+        query = (
+            "summarise https://example.com/page.html and/or compare notes.txt "
+            "via https://example.com/?next=/page.html"
+        )
+
+        assert resolve_file_arguments([query]) == []
+
+    def test_dot_relative_paths_detected(self, tmp_path, monkeypatch):
+        """Test ./ and ../ prefixed paths resolve against the working directory."""
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        local_file = work_dir / "README.md"
+        local_file.write_text("Readme")
+        parent_file = tmp_path / "x.txt"
+        parent_file.write_text("Parent")
+        monkeypatch.chdir(work_dir)
+
+        result = resolve_file_arguments(["compare ./README.md with ../x.txt"])
+
+        assert sorted(result) == sorted([local_file.resolve(), parent_file.resolve()])
+
+    def test_key_value_path_detected(self, tmp_path):
+        """Test the value of a key=value token is checked as a path."""
+        test_file = tmp_path / "config.yaml"
+        test_file.write_text("Config")
+
+        result = resolve_file_arguments([f"load key={test_file} now"])
+
+        assert result == [test_file.resolve()]
+
+    def test_query_without_path_characters_skips_tokenising(self, monkeypatch):
+        """Test plain prose returns early without inspecting any tokens."""
+
+        def fail(_token: str) -> str | None:
+            raise AssertionError("tokeniser should not run")
+
+        monkeypatch.setattr(file_handler, "_path_candidate", fail)
+
+        assert resolve_file_arguments(["what is the capital of France?"]) == []
+
+    def test_path_repeated_across_queries_resolved_once(self, tmp_path, monkeypatch):
+        """Test a path mentioned in several query arguments is resolved once."""
+        test_file = tmp_path / "shared.txt"
+        test_file.write_text("Shared")
+        resolved: list[Path] = []
+        original = file_handler._resolve_path
+
+        def spy(path: Path, files: set[Path]) -> None:
+            resolved.append(path)
+            original(path, files)
+
+        monkeypatch.setattr(file_handler, "_resolve_path", spy)
+
+        result = resolve_file_arguments([f"check {test_file}", f"and again {test_file}"])
+
+        assert [p.name for p in result] == ["shared.txt"]
+        assert resolved == [test_file]
+
+    def test_tilde_path_expands_to_home(self, tmp_path, monkeypatch):
+        """Test ~/ paths in query text expand against the home directory."""
+        test_file = tmp_path / "notes.md"
+        test_file.write_text("Notes")
+        monkeypatch.setattr(file_handler, "_home_directory", lambda: tmp_path)
+
+        result = resolve_file_arguments(["summarise ~/notes.md please"])
+
+        assert result == [test_file.resolve()]
@@ -1,5 +1,8 @@
 """Tests for data models."""
 
+import pytest
+from pydantic import ValidationError
+
 from perplexity_cli.api.models import Answer, SSEMessage, WebResult
 
 
@@ -57,6 +60,13 @@ class TestWebResult:
         assert result.url == ""
         assert result.snippet is None
 
+    def test_web_result_is_frozen_and_hashable(self):
+        """Test WebResult rejects reassignment and can be used as a key."""
+        result = WebResult(name="Test", url="https://test.com")
+        with pytest.raises(ValidationError):
+            result.url = "https://other.com"
+        assert hash(result) == hash(WebResult(name="Test", url="https://test.com"))
+
 
 class TestAnswer:
     """Test Answer model."""
@@ -79,6 +89,25 @@ class TestAnswer:
         assert answer.references[0].url == "https://ref1.com"
         assert answer.references[1].url == "https://ref2.com"
 
+    def test_answer_text_without_citations(self):
+        """Test citation markers are stripped without touching the raw text."""
+        answer = Answer(text="Alpha[1] beta[23] [note].")
+        assert answer.text_without_citations() == "Alpha beta [note]."
+        assert answer.text == "Alpha[1] beta[23] [note]."
+
+    def test_answer_copy_strips_updated_text(self):
+        """Test a copy with new text strips its own text, not the original's."""
+        answer = Answer(text="Alpha[1].")
+        answer.text_without_citations()
+        copy = answer.model_copy(update={"text": "Beta[2]."})
+        assert copy.text_without_citations() == "Beta."
+
+    def test_answer_is_frozen(self):
+        """Test Answer fields cannot be reassigned."""
+        answer = Answer(text="Answer text")
+        with pytest.raises(ValidationError):
+            answer.text = "Changed"
+
 
 class TestSSEMessageWithWebResults:
     """Test SSEMessage web results extraction."""
@@ -2,6 +2,7 @@
 
 import base64
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
 from pydantic import ValidationError
@@ -22,17 +23,44 @@ from perplexity_cli.utils.rate_limiter_models import (
     RateLimiterStats,
 )
 
+_B64_TEST_CONTENT = base64.b64encode(b"test content").decode("ascii")
+_B64_TEST = base64.b64encode(b"test").decode("ascii")
+
+# Already-trusted metadata for the CacheContent tests, which only validate
+# the content wrapper itself.
+_TRUSTED_METADATA = CacheMetadata.model_construct(
+    last_sync_time=datetime(2025, 1, 15),
+    total_threads=2,
+)
+
+
+@pytest.fixture(scope="module")
+def clock():
+    """Provide one ``now`` reading and the future instants derived from it.
+
+    The models only reject timestamps later than the moment they validate, so
+    a single reading taken at module setup stays in the past for every test
+    while ``future_hour`` and ``future_day`` stay in the future.
+    """
+    now = datetime.now()
+    return SimpleNamespace(
+        now=now,
+        future_hour=now + timedelta(hours=1),
+        future_day=now + timedelta(days=1),
+        ts=now.timestamp(),
+    )
+
 
 class TestTokenFormat:
     """Test TokenFormat model."""
 
-    def test_token_format_creation_valid(self):
+    def test_token_format_creation_valid(self, clock):
         """Test TokenFormat creation with valid data."""
         token_fmt = TokenFormat(
             version=2,
             encrypted=True,
             token="test-token-123",
-            created_at=datetime.now(),
+            created_at=clock.now,
         )
         assert token_fmt.version == 2
         assert token_fmt.encrypted is True
@@ -48,35 +76,36 @@ class TestTokenFormat:
         assert token_fmt.token == "test-token"
         assert token_fmt.cookies == "encrypted-cookies-string"
 
-    def test_token_format_empty_token_rejected(self):
-        """Test that empty tokens are rejected."""
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"token": ""}, id="empty-token"),
+            pytest.param({"token": "test", "version": 3}, id="unsupported-version"),
+        ],
+    )
+    def test_token_format_rejected(self, kwargs):
+        """Test that empty tokens and unsupported versions are rejected."""
         with pytest.raises(ValidationError):
-            TokenFormat(token="")
+            TokenFormat(**kwargs)
 
-    def test_token_format_future_created_at_rejected(self):
+    def test_token_format_future_created_at_rejected(self, clock):
         """Test that future created_at is rejected."""
-        future = datetime.now() + timedelta(days=1)
         with pytest.raises(ValidationError):
-            TokenFormat(token="test", created_at=future)
+            TokenFormat(token="test", created_at=clock.future_day)
 
-    def test_token_format_version_bounds(self):
-        """Test version field bounds."""
-        # Valid versions
-        TokenFormat(token="test", version=1)
-        TokenFormat(token="test", version=2)
-
-        # Invalid version
-        with pytest.raises(ValidationError):
-            TokenFormat(token="test", version=3)
+    @pytest.mark.parametrize("version", [1, 2])
+    def test_token_format_supported_versions(self, version):
+        """Test that both supported versions are accepted."""
+        assert TokenFormat(token="test", version=version).version == version
 
 
 class TestCacheMetadata:
     """Test CacheMetadata model."""
 
-    def test_cache_metadata_creation(self):
+    def test_cache_metadata_creation(self, clock):
         """Test CacheMetadata creation."""
         metadata = CacheMetadata(
-            last_sync_time=datetime.now(),
+            last_sync_time=clock.now,
             oldest_thread_date="2025-01-01",
             newest_thread_date="2025-01-15",
             total_threads=42,
@@ -84,17 +113,16 @@ class TestCacheMetadata:
         assert metadata.total_threads == 42
         assert metadata.oldest_thread_date == "2025-01-01"
 
-    def test_cache_metadata_future_sync_rejected(self):
+    def test_cache_metadata_future_sync_rejected(self, clock):
         """Test that future sync time is rejected."""
-        future = datetime.now() + timedelta(hours=1)
         with pytest.raises(ValidationError):
-            CacheMetadata(last_sync_time=future)
+            CacheMetadata(last_sync_time=clock.future_hour)
 
-    def test_cache_metadata_negative_threads_rejected(self):
+    def test_cache_metadata_negative_threads_rejected(self, clock):
         """Test that negative thread count is rejected."""
         with pytest.raises(ValidationError):
             CacheMetadata(
-                last_sync_time=datetime.now(),
+                last_sync_time=clock.now,
                 total_threads=-1,
             )
 
@@ -117,13 +145,12 @@ class TestCacheFormat:
         with pytest.raises(ValidationError):
             CacheFormat(cache="")
 
-    def test_cache_format_future_created_at_rejected(self):
+    def test_cache_format_future_created_at_rejected(self, clock):
         """Test that future created_at is rejected."""
-        future = datetime.now() + timedelta(days=1)
         with pytest.raises(ValidationError):
             CacheFormat(
                 cache="test",
-                created_at=future,
+                created_at=clock.future_day,
             )
 
 
@@ -132,13 +159,9 @@ class TestCacheContent:
 
     def test_cache_content_creation(self):
         """Test CacheContent creation."""
-        metadata = CacheMetadata(
-            last_sync_time=datetime.now(),
-            total_threads=2,
-        )
         content = CacheContent(
             version=1,
-            metadata=metadata,
+            metadata=_TRUSTED_METADATA,
             threads=[
                 {
                     "url": "https://example.com/thread1",
@@ -157,19 +180,17 @@ class TestCacheContent:
 
     def test_cache_content_thread_missing_url_rejected(self):
         """Test that thread without URL is rejected."""
-        metadata = CacheMetadata(last_sync_time=datetime.now())
         with pytest.raises(ValidationError):
             CacheContent(
-                metadata=metadata,
+                metadata=_TRUSTED_METADATA,
                 threads=[{"title": "No URL"}],
             )
 
     def test_cache_content_thread_missing_title_rejected(self):
         """Test that thread without title is rejected."""
-        metadata = CacheMetadata(last_sync_time=datetime.now())
         with pytest.raises(ValidationError):
             CacheContent(
-                metadata=metadata,
+                metadata=_TRUSTED_METADATA,
                 threads=[{"url": "https://example.com"}],
             )
 
@@ -232,43 +253,46 @@ class TestRateLimiterConfig:
         assert config.requests_per_period == 20
         assert config.period_seconds == pytest.approx(60.0)
 
-    def test_rate_limiter_config_zero_requests_rejected(self):
-        """Test that zero requests is rejected."""
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"requests_per_period": 0, "period_seconds": 60.0}, id="zero-requests"),
+            pytest.param({"requests_per_period": 10, "period_seconds": 0.0}, id="zero-period"),
+        ],
+    )
+    def test_rate_limiter_config_rejected(self, kwargs):
+        """Test that zero requests or a zero period is rejected."""
         with pytest.raises(ValidationError):
-            RateLimiterConfig(
-                requests_per_period=0,
-                period_seconds=60.0,
-            )
+            RateLimiterConfig(**kwargs)
 
-    def test_rate_limiter_config_zero_period_rejected(self):
-        """Test that zero period is rejected."""
+    def test_rate_limiter_config_is_immutable(self):
+        """Test that the config rejects mutation and unknown fields."""
+        config = RateLimiterConfig(requests_per_period=20, period_seconds=60.0)
         with pytest.raises(ValidationError):
-            RateLimiterConfig(
-                requests_per_period=10,
-                period_seconds=0.0,
-            )
+            config.requests_per_period = 10
+        with pytest.raises(ValidationError):
+            RateLimiterConfig(requests_per_period=20, period_seconds=60.0, burst=5)
 
 
 class TestRateLimiterState:
     """Test RateLimiterState model."""
 
-    def test_rate_limiter_state_creation(self):
+    def test_rate_limiter_state_creation(self, clock):
         """Test RateLimiterState creation."""
-        now = datetime.now().timestamp()
         state = RateLimiterState(
             tokens=10.0,
-            last_refill_time=now,
+            last_refill_time=clock.ts,
             requests_per_period=20,
             period_seconds=60.0,
         )
         assert state.tokens == pytest.approx(10.0)
 
-    def test_rate_limiter_state_negative_tokens_rejected(self):
+    def test_rate_limiter_state_negative_tokens_rejected(self, clock):
         """Test that negative tokens are rejected."""
         with pytest.raises(ValidationError):
             RateLimiterState(
                 tokens=-1.0,
-                last_refill_time=datetime.now().timestamp(),
+                last_refill_time=clock.ts,
                 requests_per_period=20,
                 period_seconds=60.0,
             )
@@ -317,70 +341,43 @@ class TestFileAttachment:
 
     def test_file_attachment_creation_valid(self):
         """Test FileAttachment creation with valid data."""
-        encoded_data = base64.b64encode(b"test content").decode("ascii")
         attachment = FileAttachment(
             filename="test.txt",
             content_type="text/plain",
-            data=encoded_data,
+            data=_B64_TEST_CONTENT,
         )
         assert attachment.filename == "test.txt"
         assert attachment.content_type == "text/plain"
-        assert attachment.data == encoded_data
-
-    def test_file_attachment_empty_filename_rejected(self):
-        """Test that empty filename is rejected."""
-        encoded_data = base64.b64encode(b"test").decode("ascii")
+        assert attachment.data == _B64_TEST_CONTENT
+
+    @pytest.mark.parametrize(
+        "case",
+        [
+            pytest.param(({"filename": ""}, "non-empty"), id="empty-filename"),
+            pytest.param(({"filename": "a" * 256 + ".txt"}, "<=255"), id="long-filename"),
+            pytest.param(({"content_type": ""}, "non-empty"), id="empty-content-type"),
+            pytest.param(({"data": "not-valid-base64!!!"}, "base64"), id="invalid-base64"),
+        ],
+    )
+    def test_file_attachment_rejected(self, case):
+        """Test that each invalid field is rejected with a matching message."""
+        overrides, message = case
+        fields = {"filename": "test.txt", "content_type": "text/plain", "data": _B64_TEST}
         with pytest.raises(ValidationError) as exc_info:
-            FileAttachment(
-                filename="",
-                content_type="text/plain",
-                data=encoded_data,
-            )
-        assert "non-empty" in str(exc_info.value).lower()
-
-    def test_file_attachment_long_filename_rejected(self):
-        """Test that filename exceeding 255 characters is rejected."""
-        encoded_data = base64.b64encode(b"test").decode("ascii")
-        long_name = "a" * 256 + ".txt"
-        with pytest.raises(ValidationError):
-            FileAttachment(
-                filename=long_name,
-                content_type="text/plain",
-                data=encoded_data,
-            )
-
-    def test_file_attachment_empty_content_type_rejected(self):
-        """Test that empty content_type is rejected."""
-        encoded_data = base64.b64encode(b"test").decode("ascii")
-        with pytest.raises(ValidationError):
-            FileAttachment(
-                filename="test.txt",
-                content_type="",
-                data=encoded_data,
-            )
-
-    def test_file_attachment_invalid_base64_rejected(self):
-        """Test that invalid base64 data is rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            FileAttachment(
-                filename="test.txt",
-                content_type="text/plain",
-                data="not-valid-base64!!!",
-            )
-        assert "base64" in str(exc_info.value).lower()
+            FileAttachment(**(fields | overrides))
+        assert message in str(exc_info.value).lower()
 
     def test_file_attachment_serialization(self):
         """Test FileAttachment serialization to dict."""
-        encoded_data = base64.b64encode(b"test content").decode("ascii")
         attachment = FileAttachment(
             filename="test.txt",
             content_type="text/plain",
-            data=encoded_data,
+            data=_B64_TEST_CONTENT,
         )
         data_dict = attachment.model_dump()
         assert data_dict["filename"] == "test.txt"
         assert data_dict["content_type"] == "text/plain"
-        assert data_dict["data"] == encoded_data
+        assert data_dict["data"] == _B64_TEST_CONTENT
 
     def test_file_attachment_in_query_params(self):
         """Test S3 URL attachment integration with QueryParams."""
@@ -418,15 +415,12 @@ class TestQueryParamsSearchMode:
         params = QueryParams()
         assert params.search_implementation_mode == "standard"
 
-    def test_search_mode_standard_accepted(self):
-        """Test that 'standard' mode is accepted."""
-        params = QueryParams(search_implementation_mode="standard")
-        assert params.search_implementation_mode == "standard"
-
-    def test_search_mode_multi_step_accepted(self):
-        """Test that 'multi_step' mode is accepted."""
-        params = QueryParams(search_implementation_mode="multi_step")
-        assert params.search_implementation_mode == "multi_step"
+    @pytest.mark.parametrize("mode", ["standard", "multi_step"])
+    def test_search_mode_accepted_and_serialised(self, mode):
+        """Test that each supported mode is accepted and sent in the request dict."""
+        params = QueryParams(search_implementation_mode=mode)
+        assert params.search_implementation_mode == mode
+        assert params.to_dict()["search_implementation_mode"] == mode
 
     def test_search_mode_invalid_rejected(self):
         """Test that invalid modes are rejected."""
@@ -435,19 +429,6 @@ class TestQueryParamsSearchMode:
         assert "standard" in str(exc_info.value)
         assert "multi_step" in str(exc_info.value)
 
-    def test_search_mode_serialization(self):
-        """Test that search_implementation_mode is serialized correctly."""
-        params = QueryParams(search_implementation_mode="multi_step")
-        data = params.to_dict()
-        assert data["search_implementation_mode"] == "multi_step"
-
-    def test_search_mode_in_request_dict(self):
-        """Test that search_implementation_mode is included in API request dict."""
-        params = QueryParams(search_implementation_mode="multi_step")
-        request_dict = params.to_dict()
-        assert "search_implementation_mode" in request_dict
-        assert request_dict["search_implementation_mode"] == "multi_step"
-
     def test_extra_request_fields_are_preserved(self):
         """Experimental request params survive serialisation."""
         params = QueryParams.model_construct(workflow_key="deep_research", search_mode="research")
@@ -5,12 +5,13 @@ and applies the requested date range only to the returned/exported view, so
 that narrow exports never delete broader cached history.
 """
 
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from perplexity_cli.threads.exporter import ThreadRecord
 from perplexity_cli.threads.scraper import ThreadScraper, _validate_date_params
+from tests.helpers.fake_services import FakeThreadCache
 
 
 def _make_thread(title: str, date: str, slug: str) -> ThreadRecord:
@@ -23,31 +24,36 @@ def _make_thread(title: str, date: str, slug: str) -> ThreadRecord:
 
 
 # Threads spanning January and February 2026
-_THREADS_ALL = [
+_THREADS_ALL: tuple[ThreadRecord, ...] = (
     _make_thread("Feb 10", "2026-02-10T12:00:00Z", "feb-10"),
     _make_thread("Feb 05", "2026-02-05T09:00:00Z", "feb-05"),
     _make_thread("Jan 20", "2026-01-20T15:00:00Z", "jan-20"),
     _make_thread("Jan 10", "2026-01-10T08:00:00Z", "jan-10"),
     _make_thread("Dec 25", "2025-12-25T10:00:00Z", "dec-25"),
-]
+)
+
+# The February threads an API gap-fetch returns, and a cache payload holding
+# only the December thread
+_FEB_THREADS = list(_THREADS_ALL[:2])
+_CACHED_DEC_PAYLOAD = {
+    "threads": [
+        {"title": t.title, "url": t.url, "created_at": t.created_at} for t in _THREADS_ALL[4:]
+    ]
+}
 
 
 @pytest.fixture
-def mock_cache_manager():
-    """Provide a mock ThreadCacheManager."""
-    cm = MagicMock()
-    cm.requires_fresh_data.return_value = (True, None, None)
-    cm.load_cache.return_value = None
-    cm.save_cache = MagicMock()
-    return cm
+def thread_cache():
+    """Provide a cache fake that always asks for fresh data."""
+    return FakeThreadCache()
 
 
 @pytest.fixture
-def scraper(mock_cache_manager):
-    """Provide a ThreadScraper wired to the mock cache manager."""
+def scraper(thread_cache):
+    """Provide a ThreadScraper wired to the FakeThreadCache fixture."""
     return ThreadScraper(
         token='{"user": {"accessToken": "test-token"}}',
-        cache_manager=mock_cache_manager,
+        cache_manager=thread_cache,
     )
 
 
@@ -55,92 +61,63 @@ class TestCacheDateRangeFiltering:
     """Verify the cache receives the complete merged set while the returned
     view is filtered by the requested date range."""
 
+    @pytest.mark.parametrize(
+        ("from_date", "to_date", "expected_titles"),
+        [
+            ("2026-02-01", None, {"Feb 10", "Feb 05"}),
+            ("2026-01-01", "2026-01-31", {"Jan 20", "Jan 10"}),
+            (None, None, {t.title for t in _THREADS_ALL}),
+        ],
+        ids=["from-date", "both-dates", "no-filter"],
+    )
     @pytest.mark.asyncio
     async def test_cache_receives_complete_set_while_result_is_filtered(
-        self, scraper, mock_cache_manager
+        self, scraper, from_date, to_date, expected_titles
     ):
-        """When from_date is provided, save_cache must receive the complete
-        fetched set while the returned list is narrowed to that date."""
+        """save_cache must receive the complete fetched set while the returned
+        list is narrowed to the requested date range."""
         with patch.object(
             scraper,
             "_fetch_all_threads_from_api",
             new_callable=AsyncMock,
             return_value=list(_THREADS_ALL),
         ):
-            result = await scraper.scrape_all_threads(from_date="2026-02-01")
+            result = await scraper.scrape_all_threads(from_date=from_date, to_date=to_date)
 
-        # The returned list should contain only February threads
-        assert len(result) == 2
-        assert all("Feb" in t.title for t in result)
+        assert {t.title for t in result} == expected_titles
 
         # The cache should receive the complete set, not the filtered one
-        mock_cache_manager.save_cache.assert_called_once()
-        cached_threads = mock_cache_manager.save_cache.call_args[0][0]
-        assert len(cached_threads) == 5
-
-    @pytest.mark.asyncio
-    async def test_cache_receives_complete_set_with_to_date(self, scraper, mock_cache_manager):
-        """When both dates are provided, save_cache must receive the complete
-        fetched set while the returned list is narrowed to that range."""
-        with patch.object(
-            scraper,
-            "_fetch_all_threads_from_api",
-            new_callable=AsyncMock,
-            return_value=list(_THREADS_ALL),
-        ):
-            result = await scraper.scrape_all_threads(from_date="2026-01-01", to_date="2026-01-31")
-
-        assert len(result) == 2
-        assert all("Jan" in t.title for t in result)
-
-        cached_threads = mock_cache_manager.save_cache.call_args[0][0]
+        [cached_threads] = scraper.cache_manager.saved
         assert len(cached_threads) == 5
 
     @pytest.mark.asyncio
-    async def test_save_cache_receives_all_threads_when_no_date_filter(
-        self, scraper, mock_cache_manager
-    ):
-        """When no date range is specified, save_cache should receive
-        all fetched threads."""
+    async def test_no_date_filter_passes_fetched_list_through(self, scraper, thread_cache):
+        """Without a date range the fetched list is returned and cached as-is."""
+        fetched = list(_THREADS_ALL)
         with patch.object(
             scraper,
             "_fetch_all_threads_from_api",
             new_callable=AsyncMock,
-            return_value=list(_THREADS_ALL),
+            return_value=fetched,
         ):
             result = await scraper.scrape_all_threads()
 
-        assert len(result) == 5
-
-        cached_threads = mock_cache_manager.save_cache.call_args[0][0]
-        assert len(cached_threads) == 5
+        assert result is fetched
+        assert thread_cache.saved == [fetched]
+        assert thread_cache.saved[0] is fetched
 
     @pytest.mark.asyncio
-    async def test_full_merged_set_is_persisted_and_result_filtered(
-        self, scraper, mock_cache_manager
-    ):
+    async def test_full_merged_set_is_persisted_and_result_filtered(self, scraper, thread_cache):
         """When cache has old threads and API returns new ones, the full
         merged set must be persisted while only the returned view is filtered."""
-        # Simulate existing cache with December thread
-        cached_dec = [_make_thread("Dec 25", "2025-12-25T10:00:00Z", "dec-25")]
-        mock_cache_manager.load_cache.return_value = {
-            "threads": [
-                {"title": t.title, "url": t.url, "created_at": t.created_at} for t in cached_dec
-            ]
-        }
-        mock_cache_manager.merge_threads.return_value = list(_THREADS_ALL)
-
-        # API returns February threads
-        feb_threads = [
-            _make_thread("Feb 10", "2026-02-10T12:00:00Z", "feb-10"),
-            _make_thread("Feb 05", "2026-02-05T09:00:00Z", "feb-05"),
-        ]
+        thread_cache.cached = _CACHED_DEC_PAYLOAD
+        thread_cache.merged = list(_THREADS_ALL)
 
         with patch.object(
             scraper,
             "_fetch_all_threads_from_api",
             new_callable=AsyncMock,
-            return_value=feb_threads,
+            return_value=_FEB_THREADS,
         ):
             result = await scraper.scrape_all_threads(from_date="2026-02-01")
 
@@ -148,11 +125,23 @@ class TestCacheDateRangeFiltering:
         assert len(result) == 2
 
         # Cache should receive the full merged set of 5 — not the filtered 2
-        cached_threads = mock_cache_manager.save_cache.call_args[0][0]
+        [cached_threads] = thread_cache.saved
         assert len(cached_threads) == 5
         titles = {t.title for t in cached_threads}
         assert titles == {"Dec 25", "Jan 10", "Jan 20", "Feb 05", "Feb 10"}
 
+    def test_filter_compares_calendar_date_in_thread_offset(self, scraper):
+        """Bounds are inclusive whole days in each timestamp's own offset."""
+        threads = [
+            _make_thread("Late Jan 31", "2026-01-31T23:30:00-05:00", "late-jan-31"),
+            _make_thread("Feb 01", "2026-02-01T00:00:00Z", "feb-01"),
+            _make_thread("Jan 01", "2026-01-01T00:00:00Z", "jan-01"),
+        ]
+
+        result = scraper._filter_by_date_range(threads, "2026-01-01", "2026-01-31")
+
+        assert [t.title for t in result] == ["Late Jan 31", "Jan 01"]
+
 
 class TestCachePreservationScenario:
     """Broad fetches must not delete earlier cached history.
@@ -221,7 +210,7 @@ class TestThreadScraperRateLimiting:
     """Verify thread scraping rate limiting happens before requests."""
 
     @pytest.mark.asyncio
-    async def test_rate_limiter_acquired_before_request(self, mock_cache_manager):
+    async def test_rate_limiter_acquired_before_request(self, thread_cache):
         """Test the scraper waits on the limiter before issuing a request."""
         rate_limiter = AsyncMock()
         rate_limiter.acquire.return_value = 0.0
@@ -230,7 +219,7 @@ class TestThreadScraperRateLimiting:
             token='{"user": {"accessToken": "test-token"}}',
             cookies={"cf_clearance": "cookie"},
             rate_limiter=rate_limiter,
-            cache_manager=mock_cache_manager,
+            cache_manager=thread_cache,
         )
 
         mock_response = Mock()
@@ -255,9 +244,9 @@ class TestThreadScraperMalformedPayloads:
     """Verify malformed upstream thread payloads fail explicitly."""
 
     @pytest.mark.asyncio
-    async def test_fetch_threads_rejects_non_dict_entry(self, mock_cache_manager):
+    async def test_fetch_threads_rejects_non_dict_entry(self, thread_cache):
         scraper = ThreadScraper(
-            token='{"user": {"accessToken": "test-token"}}', cache_manager=mock_cache_manager
+            token='{"user": {"accessToken": "test-token"}}', cache_manager=thread_cache
         )
 
         mock_response = Mock()
@@ -276,9 +265,9 @@ class TestThreadScraperMalformedPayloads:
                 await scraper._fetch_all_threads_from_api("test-token")
 
     @pytest.mark.asyncio
-    async def test_fetch_threads_rejects_missing_timestamp(self, mock_cache_manager):
+    async def test_fetch_threads_rejects_missing_timestamp(self, thread_cache):
         scraper = ThreadScraper(
-            token='{"user": {"accessToken": "test-token"}}', cache_manager=mock_cache_manager
+            token='{"user": {"accessToken": "test-token"}}', cache_manager=thread_cache
         )
 
         mock_response = Mock()
@@ -299,8 +288,8 @@ class TestThreadScraperMalformedPayloads:
                 await scraper._fetch_all_threads_from_api("test-token")
 
     @pytest.mark.asyncio
-    async def test_scrape_all_threads_rejects_invalid_session_user_shape(self, mock_cache_manager):
-        scraper = ThreadScraper(token='{"user": "bad"}', cache_manager=mock_cache_manager)
+    async def test_scrape_all_threads_rejects_invalid_session_user_shape(self, thread_cache):
+        scraper = ThreadScraper(token='{"user": "bad"}', cache_manager=thread_cache)
 
         with pytest.raises(RuntimeError, match="invalid session user data"):
             await scraper.scrape_all_threads()
@@ -1,18 +1,25 @@
 """Tests for the thread CSV export functionality."""
 
 import csv
+import io
 import stat
 import sys
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from typing import ClassVar
 
 import pytest
 
-from perplexity_cli.threads.exporter import ThreadRecord, write_threads_csv
+from perplexity_cli.threads.exporter import ThreadRecord, _render_threads_csv, write_threads_csv
 
 _POSIX = sys.platform != "win32"
 
 
+def _render_rows(records: list[ThreadRecord]) -> list[list[str]]:
+    """Render records in memory and parse the CSV text back into rows."""
+    return list(csv.reader(io.StringIO(_render_threads_csv(records), newline="")))
+
+
 class TestThreadRecord:
     """Test the ThreadRecord dataclass."""
 
@@ -52,6 +59,13 @@ class TestThreadRecord:
         )
         assert "Python" in record.title
 
+    def test_record_is_immutable_and_slotted(self):
+        """Test that records are frozen and carry no per-instance dict."""
+        record = ThreadRecord(title="t", url="u", created_at="c")
+        with pytest.raises(FrozenInstanceError):
+            record.title = "changed"
+        assert not hasattr(record, "__dict__")
+
 
 class TestWriteThreadsCsv:
     """Test the write_threads_csv() function."""
@@ -125,6 +139,29 @@ class TestWriteThreadsCsv:
         with pytest.raises(ValueError, match="Cannot write CSV with empty records list"):
             write_threads_csv([])
 
+    def test_write_records_from_generator(self, tmp_path):
+        """Test that a one-shot generator of records is written in full."""
+        output_path = tmp_path / "threads.csv"
+        records = (
+            ThreadRecord(
+                title=f"Thread {n}",
+                url=f"https://www.perplexity.ai/search/thread-{n}",
+                created_at=f"2025-12-2{n}T08:00:00Z",
+            )
+            for n in range(3)
+        )
+
+        write_threads_csv(records, output_path)
+
+        with open(output_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert [row[1] for row in rows[1:]] == ["Thread 0", "Thread 1", "Thread 2"]
+
+    def test_write_empty_generator_raises_value_error(self):
+        """Test that an exhausted iterable is rejected like an empty list."""
+        with pytest.raises(ValueError, match="Cannot write CSV with empty records list"):
+            write_threads_csv(iter([]))
+
     def test_write_with_custom_output_path(self, tmp_path):
         """Test writing to a custom output path."""
         custom_path = tmp_path / "custom" / "output" / "my-threads.csv"
@@ -162,9 +199,8 @@ class TestWriteThreadsCsv:
         assert result_path.name.startswith("threads-")
         assert result_path.name.endswith(".csv")
 
-    def test_csv_header_order(self, tmp_path):
+    def test_csv_header_order(self):
         """Test that CSV header columns are in the correct order."""
-        output_path = tmp_path / "threads.csv"
         records = [
             ThreadRecord(
                 title="Header test",
@@ -173,17 +209,12 @@ class TestWriteThreadsCsv:
             )
         ]
 
-        write_threads_csv(records, output_path)
-
-        with open(output_path, newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            header = next(reader)
+        header = _render_rows(records)[0]
 
         assert header == ["created_at", "title", "url"]
 
-    def test_csv_preserves_special_characters(self, tmp_path):
+    def test_csv_preserves_special_characters(self):
         """Test that special characters in titles are preserved in CSV."""
-        output_path = tmp_path / "threads.csv"
         records = [
             ThreadRecord(
                 title='Title with "quotes", commas, and newlines\n in it',
@@ -192,11 +223,7 @@ class TestWriteThreadsCsv:
             )
         ]
 
-        write_threads_csv(records, output_path)
-
-        with open(output_path, newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            rows = list(reader)
+        rows = _render_rows(records)
 
         assert rows[1][1] == 'Title with "quotes", commas, and newlines\n in it'
 
@@ -247,48 +274,35 @@ class TestFormulaNeutralisation:
         fields[field] = value
         return ThreadRecord(**fields)
 
-    @staticmethod
-    def _read_rows(output_path: Path) -> list[list[str]]:
-        with output_path.open(newline="", encoding="utf-8") as csvfile:
-            return list(csv.reader(csvfile))
-
     @pytest.mark.parametrize("field", ["title", "url", "created_at"])
     @pytest.mark.parametrize("prefix", ["=", "+", "-", "@"])
-    def test_formula_prefix_neutralised_in_every_column(self, tmp_path, field, prefix):
+    def test_formula_prefix_neutralised_in_every_column(self, field, prefix):
         """A formula prefix in any column gets a leading apostrophe."""
         value = prefix + "SUM(A1)"
-        output_path = tmp_path / "threads.csv"
-        write_threads_csv([self._build_record(field, value)], output_path)
-        rows = self._read_rows(output_path)
+        rows = _render_rows([self._build_record(field, value)])
         assert rows[1][self._COLUMN_INDEX[field]] == "'" + value
 
     @pytest.mark.parametrize("leading", ["  ", "\t", "\n", "\r\n"])
     @pytest.mark.parametrize("prefix", ["=", "+", "-", "@"])
-    def test_leading_whitespace_variants_neutralised(self, tmp_path, leading, prefix):
+    def test_leading_whitespace_variants_neutralised(self, leading, prefix):
         """A prefix after leading whitespace still gets neutralised."""
         value = leading + prefix + "cmd()"
-        output_path = tmp_path / "threads.csv"
-        write_threads_csv([self._build_record("title", value)], output_path)
-        rows = self._read_rows(output_path)
+        rows = _render_rows([self._build_record("title", value)])
         assert rows[1][1] == "'" + value
 
-    def test_benign_cells_preserved_exactly(self, tmp_path):
+    def test_benign_cells_preserved_exactly(self):
         """Unicode, quotes, commas and newlines are preserved untouched."""
         title = 'Title with "quotes", commas, and\nnewlines'
         url = "https://example.com/h\u00e9llo?q=caf\u00e9&x=1"
         created_at = "2025-01-01T13:51:50Z"
         record = ThreadRecord(title=title, url=url, created_at=created_at)
-        output_path = tmp_path / "threads.csv"
-        write_threads_csv([record], output_path)
-        rows = self._read_rows(output_path)
+        rows = _render_rows([record])
         assert rows[1] == [created_at, title, url]
 
-    def test_whitespace_only_and_empty_cells_unchanged(self, tmp_path):
+    def test_whitespace_only_and_empty_cells_unchanged(self):
         """Whitespace-only and empty cells are left exactly as provided."""
         record = ThreadRecord(title="   ", url="", created_at="  ")
-        output_path = tmp_path / "threads.csv"
-        write_threads_csv([record], output_path)
-        rows = self._read_rows(output_path)
+        rows = _render_rows([record])
         assert rows[1] == ["  ", "   ", ""]
 
 
@@ -186,29 +186,35 @@ class TestCheckTokenAge:
         token_manager._check_token_age(12345)  # type: ignore[arg-type]  # owner: test-infrastructure; reason: deliberately passes a non-string to exercise the TypeError path
 
 
+def _decrypt_record_cookies(manager: TokenManager, record: dict, version: int):
+    """Extract and decrypt the cookies of a token record."""
+    return manager._decrypt_cookies(manager._extract_encrypted_cookies(record, version))
+
+
 class TestDecryptCookies:
     """Tests for _decrypt_cookies edge cases."""
 
     def test_v1_format_returns_none(self, token_manager):
         """v1 format (version != 2) returns None."""
-        result = token_manager._decrypt_cookies({"token": "x"}, version=1)
+        result = _decrypt_record_cookies(token_manager, {"token": "x"}, version=1)
         assert result is None
 
     def test_v2_no_cookies_key_returns_none(self, token_manager):
         """v2 format without cookies key returns None."""
-        result = token_manager._decrypt_cookies({"token": "x"}, version=2)
+        result = _decrypt_record_cookies(token_manager, {"token": "x"}, version=2)
         assert result is None
 
     def test_falsy_encrypted_cookies_returns_none(self, token_manager):
         """v2 format with empty/falsy cookies value returns None."""
-        result = token_manager._decrypt_cookies({"token": "x", "cookies": ""}, version=2)
+        result = _decrypt_record_cookies(token_manager, {"token": "x", "cookies": ""}, version=2)
         assert result is None
 
     def test_valid_cookies_decrypted(self, token_manager):
         """Valid encrypted cookies are decrypted and returned."""
         cookies = {"session": "abc", "cf_clearance": "xyz"}
         encrypted = encrypt_token(json.dumps(cookies))
-        result = token_manager._decrypt_cookies({"token": "x", "cookies": encrypted}, version=2)
+        record = {"token": "x", "cookies": encrypted}
+        result = _decrypt_record_cookies(token_manager, record, version=2)
         assert result == cookies
 
 
@@ -300,6 +306,64 @@ class TestLoadTokenRoundTrip:
         assert not temp_token_file.exists()
 
 
+class TestLoadTokenDecryptionCache:
+    """Repeat loads of an unchanged token file reuse the decrypted values."""
+
+    @pytest.fixture(autouse=True)
+    def _enable_cookie_storage(self, monkeypatch):
+        monkeypatch.setattr(
+            "perplexity_cli.auth.token_manager.get_save_cookies_enabled",
+            lambda: True,
+        )
+
+    def test_second_load_skips_decryption(self, token_manager):
+        """Loading the same record twice decrypts it only once."""
+        token_manager.save_token("tok", cookies={"a": "b"})
+        token_manager.load_token()
+        with patch("perplexity_cli.auth.token_manager.decrypt_token") as mock_decrypt:
+            token, cookies = token_manager.load_token()
+        mock_decrypt.assert_not_called()
+        assert (token, cookies) == ("tok", {"a": "b"})
+
+    def test_save_replaces_cached_token(self, token_manager):
+        """A new save is visible to the next load."""
+        token_manager.save_token("first")
+        token_manager.load_token()
+        token_manager.save_token("second")
+        assert token_manager.load_token()[0] == "second"
+
+    def test_cached_cookies_are_copied(self, token_manager):
+        """Mutating returned cookies does not leak into later loads."""
+        token_manager.save_token("tok", cookies={"a": "b"})
+        _, cookies = token_manager.load_token()
+        cookies["a"] = "changed"
+        assert token_manager.load_token()[1] == {"a": "b"}
+
+    def test_cached_load_logs_cookie_details(self, token_manager, caplog):
+        """A cache hit emits the same cookie debug log as the first load."""
+        token_manager.save_token("tok", cookies={"cf_clearance": "x"})
+        with caplog.at_level(logging.DEBUG, logger="perplexity_cli"):
+            token_manager.load_token()
+            first = [r.getMessage() for r in caplog.records]
+            caplog.clear()
+            token_manager.load_token()
+            second = [r.getMessage() for r in caplog.records]
+        assert "Loaded 1 cookies, including 1 Cloudflare cookies" in first
+        assert second == first
+
+    @pytest.mark.parametrize("malformed", [{"a": "b"}, ["a", "b"]])
+    def test_non_string_cookies_load_without_cookies(
+        self, token_manager, temp_token_file, malformed
+    ):
+        """An unhashable cookies value is ignored rather than breaking the cache key."""
+        _write_token_file(
+            temp_token_file,
+            {"version": 2, "encrypted": True, "token": encrypt_token("tok"), "cookies": malformed},
+        )
+        assert token_manager.load_token() == ("tok", None)
+        assert token_manager.load_token() == ("tok", None)
+
+
 class TestClearTokenOSError:
     """Tests for OSError handling during token deletion."""
 
@@ -7,10 +7,10 @@ Tests assert exact production exception classes, never broad ``Exception``
 catches.
 """
 
-import base64
 import logging
 from unittest.mock import patch
 
+import httpx
 import pytest
 
 from perplexity_cli.attachments.upload_manager import AttachmentUploader
@@ -24,7 +24,9 @@ from tests.helpers.fake_transport import FakeHttpResponse, FakeHttpTransport
 from tests.helpers.fake_uploader import FakeS3UploadClient, FakeS3UploadClientFactory
 
 _S3_OBJECT_URL = "https://ppl-ai-file-upload.s3.amazonaws.com/test.txt"
-_UPLOAD_FACTORY = "perplexity_cli.attachments.upload_manager._get_httpx_async_client_factory"
+_BASE_URL = "https://www.perplexity.ai"
+
+_ENCODED_CONTENT = "VGVzdCBmaWxlIGNvbnRlbnQ="  # base64 of b"Test file content"
 
 _VALID_FIELDS = {
     "policy": "base64-encoded-policy",
@@ -34,27 +36,31 @@ _VALID_FIELDS = {
 }
 
 
-def _make_attachment(
-    *, filename: str = "test.txt", body: bytes = b"Test file content"
-) -> FileAttachment:
-    """Build a real FileAttachment from raw bytes."""
-    return FileAttachment(
-        filename=filename,
-        content_type="text/plain",
-        data=base64.b64encode(body).decode(),
-    )
+def _make_attachment(*, filename: str = "test.txt") -> FileAttachment:
+    """Build a real FileAttachment carrying the shared encoded payload."""
+    return FileAttachment(filename=filename, content_type="text/plain", data=_ENCODED_CONTENT)
+
+
+@pytest.fixture(scope="module")
+def uploader() -> AttachmentUploader:
+    """Share one uploader across the module; it carries no per-test state.
 
+    ``base_url`` is explicit so construction never reads configuration
+    before the function-scoped config isolation is in place.
+    """
+    return AttachmentUploader(token="test-token", base_url=_BASE_URL)
 
-def _make_s3_client(response: FakeHttpResponse | None = None) -> FakeS3UploadClient:
-    """Create a fake S3 client for direct ``_upload_to_s3`` calls."""
-    factory = FakeS3UploadClientFactory(response or FakeHttpResponse(status_code=204))
-    return factory()
 
+@pytest.fixture(scope="module")
+def test_attachment() -> FileAttachment:
+    """Share one frozen FileAttachment across the module's tests."""
+    return _make_attachment()
 
-def _patch_s3_upload(response: FakeHttpResponse):
-    """Inject *response* as the S3 upload boundary via the factory seam."""
-    factory = FakeS3UploadClientFactory(response)
-    return patch(_UPLOAD_FACTORY, return_value=factory, autospec=True)
+
+@pytest.fixture
+def s3_client() -> FakeS3UploadClient:
+    """Create a fake S3 client answering 204 for direct ``_upload_to_s3`` calls."""
+    return FakeS3UploadClientFactory(FakeHttpResponse(status_code=204))()
 
 
 class _RaisingS3Client(FakeS3UploadClient):
@@ -69,104 +75,159 @@ class _RaisingS3Client(FakeS3UploadClient):
         raise ConnectionError("connection reset by peer")
 
 
+class _SequencedS3Client(FakeS3UploadClient):
+    """Fake S3 client answering each ``post`` with the next scripted status."""
+
+    def __init__(self, *statuses: int) -> None:
+        """Initialise with the statuses returned in call order."""
+        super().__init__(FakeHttpResponse(status_code=statuses[-1]))
+        self._statuses = list(statuses)
+
+    async def post(self, url: str, **kwargs: object) -> FakeHttpResponse:
+        """Record the request and answer with the next scripted status."""
+        await super().post(url, **kwargs)
+        return FakeHttpResponse(status_code=self._statuses[len(self.posts) - 1])
+
+
+@pytest.fixture
+def retry_sleeps(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Replace the S3 retry backoff with a recorder of failed attempt numbers."""
+    attempts: list[int] = []
+
+    async def record(attempt: int) -> None:
+        attempts.append(attempt)
+
+    monkeypatch.setattr("perplexity_cli.attachments.upload_manager._sleep_before_s3_retry", record)
+    return attempts
+
+
 class TestUploadManagerDefensive:
     """Defensive programming tests for upload manager."""
 
-    @pytest.fixture
-    def uploader(self):
-        """Create an AttachmentUploader instance."""
-        return AttachmentUploader(token="test-token")
-
-    @pytest.fixture
-    def test_attachment(self):
-        """Create a test FileAttachment."""
-        return _make_attachment()
+    def test_instances_have_no_attribute_dict(self, uploader):
+        """The uploader uses slots, so stray attributes cannot be attached."""
+        assert not hasattr(uploader, "__dict__")
 
     # -- Fail-closed signing field validation at the helper level -----------
 
     @pytest.mark.asyncio
-    async def test_upload_to_s3_with_null_fields_rejected(self, uploader, test_attachment):
+    async def test_upload_to_s3_with_null_fields_rejected(
+        self, uploader, test_attachment, s3_client
+    ):
         """Null 'fields' are rejected with UpstreamSchemaError."""
         upload_data = {"fields": None, "s3_object_url": _S3_OBJECT_URL}
 
         with pytest.raises(UpstreamSchemaError, match="fields"):
-            await uploader._upload_to_s3(test_attachment, upload_data, _make_s3_client())
+            await uploader._upload_to_s3(test_attachment, upload_data, s3_client)
 
     @pytest.mark.asyncio
-    async def test_upload_to_s3_with_empty_fields_dict_rejected(self, uploader, test_attachment):
-        """An empty 'fields' dict is rejected with UpstreamSchemaError."""
-        upload_data = {"fields": {}, "s3_object_url": _S3_OBJECT_URL}
-
-        with pytest.raises(UpstreamSchemaError, match="fields"):
-            await uploader._upload_to_s3(test_attachment, upload_data, _make_s3_client())
-
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize(
-        "falsy_value",
-        [None, False, 0, "", []],
-    )
+    @pytest.mark.parametrize("falsy_value", [None, False, 0, "", [], (), {}])
     async def test_upload_to_s3_with_falsy_fields_rejected(
-        self, uploader, test_attachment, falsy_value
+        self, uploader, test_attachment, falsy_value, s3_client
     ):
         """Any falsy 'fields' value is rejected with UpstreamSchemaError."""
         upload_data = {"fields": falsy_value, "s3_object_url": _S3_OBJECT_URL}
 
         with pytest.raises(UpstreamSchemaError, match="fields"):
-            await uploader._upload_to_s3(test_attachment, upload_data, _make_s3_client())
+            await uploader._upload_to_s3(test_attachment, upload_data, s3_client)
 
     @pytest.mark.asyncio
-    async def test_upload_to_s3_with_non_mapping_fields_rejected(self, uploader, test_attachment):
+    async def test_upload_to_s3_with_non_mapping_fields_rejected(
+        self, uploader, test_attachment, s3_client
+    ):
         """A non-mapping 'fields' value is rejected, not silently ignored."""
         upload_data = {"fields": ["unexpected", "list"], "s3_object_url": _S3_OBJECT_URL}
 
         with pytest.raises(UpstreamSchemaError, match="fields"):
-            await uploader._upload_to_s3(test_attachment, upload_data, _make_s3_client())
+            await uploader._upload_to_s3(test_attachment, upload_data, s3_client)
 
     # -- Fail-closed object URL validation at the helper level --------------
 
     @pytest.mark.asyncio
-    async def test_upload_to_s3_with_missing_object_url_rejected(self, uploader, test_attachment):
+    async def test_upload_to_s3_with_missing_object_url_rejected(
+        self, uploader, test_attachment, s3_client
+    ):
         """A missing 's3_object_url' is rejected with UpstreamSchemaError."""
         upload_data = {"fields": dict(_VALID_FIELDS)}
 
         with pytest.raises(UpstreamSchemaError, match="S3 object URL"):
-            await uploader._upload_to_s3(test_attachment, upload_data, _make_s3_client())
+            await uploader._upload_to_s3(test_attachment, upload_data, s3_client)
 
     @pytest.mark.asyncio
-    async def test_upload_to_s3_with_null_object_url_rejected(self, uploader, test_attachment):
+    async def test_upload_to_s3_with_null_object_url_rejected(
+        self, uploader, test_attachment, s3_client
+    ):
         """A null 's3_object_url' is rejected with UpstreamSchemaError."""
         upload_data = {"fields": dict(_VALID_FIELDS), "s3_object_url": None}
 
         with pytest.raises(UpstreamSchemaError, match="S3 object URL"):
-            await uploader._upload_to_s3(test_attachment, upload_data, _make_s3_client())
+            await uploader._upload_to_s3(test_attachment, upload_data, s3_client)
 
     @pytest.mark.asyncio
-    async def test_upload_to_s3_with_empty_object_url_rejected(self, uploader, test_attachment):
+    async def test_upload_to_s3_with_empty_object_url_rejected(
+        self, uploader, test_attachment, s3_client
+    ):
         """An empty 's3_object_url' is rejected with UpstreamSchemaError."""
         upload_data = {"fields": dict(_VALID_FIELDS), "s3_object_url": ""}
 
         with pytest.raises(UpstreamSchemaError, match="S3 object URL"):
-            await uploader._upload_to_s3(test_attachment, upload_data, _make_s3_client())
+            await uploader._upload_to_s3(test_attachment, upload_data, s3_client)
 
     # -- Valid presigned data ------------------------------------------------
 
     @pytest.mark.asyncio
-    async def test_upload_to_s3_with_normal_fields(self, uploader, test_attachment):
+    async def test_upload_to_s3_with_normal_fields(self, uploader, test_attachment, s3_client):
         """A valid presigned entry uploads successfully via the shared client."""
         upload_data = {
             "fields": dict(_VALID_FIELDS),
             "s3_object_url": _S3_OBJECT_URL,
         }
-        client = _make_s3_client()
-
-        result = await uploader._upload_to_s3(test_attachment, upload_data, client)
+        result = await uploader._upload_to_s3(test_attachment, upload_data, s3_client)
 
         assert result == _S3_OBJECT_URL
-        files_dict = client.last_post.kwargs["files"]
+        files_dict = s3_client.last_post.kwargs["files"]
         assert "policy" in files_dict
         assert "x-amz-signature" in files_dict
         assert "x-amz-credential" in files_dict
 
+    @pytest.mark.asyncio
+    async def test_upload_to_s3_sends_copied_attachment_payload(
+        self, uploader, test_attachment, s3_client
+    ):
+        """A model_copy with new data uploads the copy's bytes, not the original's."""
+        upload_data = {"fields": dict(_VALID_FIELDS), "s3_object_url": _S3_OBJECT_URL}
+        await uploader._upload_to_s3(test_attachment, upload_data, s3_client)
+        copied = test_attachment.model_copy(update={"data": "eHl6"})
+
+        await uploader._upload_to_s3(copied, upload_data, s3_client)
+
+        assert s3_client.last_post.kwargs["files"]["file"][1] == b"xyz"
+
+    @pytest.mark.asyncio
+    async def test_upload_to_s3_sends_real_multipart_body(self, uploader, test_attachment):
+        """A real httpx client encodes the signing fields, then the file part."""
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(204)
+
+        upload_data = {"fields": dict(_VALID_FIELDS), "s3_object_url": _S3_OBJECT_URL}
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            result = await uploader._upload_to_s3(test_attachment, upload_data, client)
+
+        assert result == _S3_OBJECT_URL
+        (request,) = sent
+        assert request.headers["content-type"].startswith("multipart/form-data")
+        body = request.content
+        assert b'name="policy"' in body
+        assert b"base64-encoded-policy" in body
+        assert b'filename="test.txt"' in body
+        assert b"Test file content" in body
+        # S3 ignores any form field that follows the file part.
+        assert body.index(b'name="file"') > body.index(b'name="key"')
+
     # -- Transport failures -----------------------------------------------
 
     @pytest.mark.asyncio
@@ -176,17 +237,60 @@ class TestUploadManagerDefensive:
             "fields": dict(_VALID_FIELDS),
             "s3_object_url": _S3_OBJECT_URL,
         }
-        attachment = _make_attachment(filename="report.txt", body=b"content")
+        attachment = _make_attachment(filename="report.txt")
 
         with pytest.raises(AttachmentUploadError, match=r"Failed to upload report\.txt to S3"):
             await uploader._upload_to_s3(attachment, upload_data, _RaisingS3Client())
 
+    # -- Transient S3 status retries ---------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_upload_retries_on_503(self, uploader, test_attachment, retry_sleeps):
+        """A 503 SlowDown is retried with backoff and the retry's 204 wins."""
+        upload_data = {"fields": dict(_VALID_FIELDS), "s3_object_url": _S3_OBJECT_URL}
+        client = _SequencedS3Client(503, 204)
+
+        result = await uploader._upload_to_s3(test_attachment, upload_data, client)
+
+        assert result == _S3_OBJECT_URL
+        assert len(client.posts) == 2
+        assert client.posts[0].kwargs["files"] is client.posts[1].kwargs["files"]
+        assert retry_sleeps == [0]
+
+    @pytest.mark.asyncio
+    async def test_upload_gives_up_after_max_attempts(
+        self, uploader, test_attachment, retry_sleeps
+    ):
+        """Persistent 5xx responses fail with the last status after bounded attempts."""
+        upload_data = {"fields": dict(_VALID_FIELDS), "s3_object_url": _S3_OBJECT_URL}
+        client = _SequencedS3Client(500, 502, 503)
+
+        with pytest.raises(AttachmentUploadError, match="status 503"):
+            await uploader._upload_to_s3(test_attachment, upload_data, client)
+
+        assert len(client.posts) == 3
+        assert retry_sleeps == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_upload_does_not_retry_client_errors(
+        self, uploader, test_attachment, retry_sleeps
+    ):
+        """A 403 from S3 is final: it is never retried."""
+        upload_data = {"fields": dict(_VALID_FIELDS), "s3_object_url": _S3_OBJECT_URL}
+        client = _SequencedS3Client(403)
+
+        with pytest.raises(AttachmentUploadError, match="status 403"):
+            await uploader._upload_to_s3(test_attachment, upload_data, client)
+
+        assert len(client.posts) == 1
+        assert retry_sleeps == []
+
     # -- Orchestration boundary fail-closed behaviour -----------------------
 
     @pytest.mark.asyncio
-    async def test_request_upload_urls_logs_on_auth_error(self, uploader):
+    async def test_request_upload_urls_logs_on_auth_error(self, uploader, test_attachment):
         """Test that API auth errors are logged with helpful message."""
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         response = FakeHttpResponse(
             ok=False,
@@ -202,20 +306,22 @@ class TestUploadManagerDefensive:
             await uploader._request_upload_urls(attachments, session)
 
     @pytest.mark.asyncio
-    async def test_upload_files_fails_closed_on_null_fields(self, uploader):
+    async def test_upload_files_fails_closed_on_null_fields(self, uploader, test_attachment):
         """A null-fields response raises without bypassing validation.
 
         The full upload_files flow validates presigned entries inside
         ``_request_upload_urls`` and must fail before any S3 upload starts.
         """
-        attachments = [_make_attachment(body=b"Test content")]
+        attachments = [test_attachment]
 
         api_response = {"results": {"uuid-1": {"fields": None, "s3_object_url": _S3_OBJECT_URL}}}
         session = FakeHttpTransport(
             FakeHttpResponse(ok=True, status_code=200, json_data=api_response)
         )
 
-        with patch.object(uploader, "_create_async_session", return_value=session, autospec=True):
+        with patch.object(
+            AttachmentUploader, "_create_async_session", return_value=session, autospec=True
+        ):
             with pytest.raises(AttachmentUploadError, match="empty presigned URL"):
                 await uploader.upload_files(attachments)
 
@@ -223,15 +329,10 @@ class TestUploadManagerDefensive:
 class TestUploadManagerQuotaHandling:
     """Tests for upload quota exhaustion and rate limit handling."""
 
-    @pytest.fixture
-    def uploader(self):
-        """Create an AttachmentUploader instance."""
-        return AttachmentUploader(token="test-token")
-
     @pytest.mark.asyncio
-    async def test_rate_limited_response_raises_quota_error(self, uploader):
+    async def test_rate_limited_response_raises_quota_error(self, uploader, test_attachment):
         """Test that rate_limited: true produces a clear quota exhaustion error."""
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         api_response = {
             "results": {
@@ -253,9 +354,9 @@ class TestUploadManagerQuotaHandling:
             await uploader._request_upload_urls(attachments, session)
 
     @pytest.mark.asyncio
-    async def test_rate_limited_error_mentions_account_settings(self, uploader):
+    async def test_rate_limited_error_mentions_account_settings(self, uploader, test_attachment):
         """Test that quota error message directs user to account settings."""
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         api_response = {
             "results": {"uuid-1": {"s3_object_url": None, "fields": None, "rate_limited": True}}
@@ -268,9 +369,9 @@ class TestUploadManagerQuotaHandling:
             await uploader._request_upload_urls(attachments, session)
 
     @pytest.mark.asyncio
-    async def test_api_error_in_response_body(self, uploader):
+    async def test_api_error_in_response_body(self, uploader, test_attachment):
         """Test that API error field is included in error message."""
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         api_response = {
             "results": {
@@ -290,9 +391,9 @@ class TestUploadManagerQuotaHandling:
             await uploader._request_upload_urls(attachments, session)
 
     @pytest.mark.asyncio
-    async def test_null_fields_no_rate_limit_no_error(self, uploader):
+    async def test_null_fields_no_rate_limit_no_error(self, uploader, test_attachment):
         """Test generic error when fields null with no rate_limited or error."""
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         api_response = {
             "results": {
@@ -312,9 +413,9 @@ class TestUploadManagerQuotaHandling:
             await uploader._request_upload_urls(attachments, session)
 
     @pytest.mark.asyncio
-    async def test_valid_response_passes_through(self, uploader):
+    async def test_valid_response_passes_through(self, uploader, test_attachment):
         """Test that a valid presigned URL response passes validation."""
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         api_response = {
             "results": {
@@ -339,9 +440,30 @@ class TestUploadManagerQuotaHandling:
         assert response_json["results"]["uuid-1"]["fields"] is not None
 
     @pytest.mark.asyncio
-    async def test_request_upload_urls_rejects_non_dict_response(self, uploader):
+    async def test_single_http_call_for_batch(self, uploader):
+        """A 50-file batch requests every presigned URL in one POST."""
+        attachments = [_make_attachment(filename=f"file-{index}.txt") for index in range(50)]
+
+        api_response = {
+            "results": {"uuid-1": {"s3_object_url": _S3_OBJECT_URL, "fields": {"key": "k"}}}
+        }
+        session = FakeHttpTransport(
+            FakeHttpResponse(ok=True, status_code=200, json_data=api_response)
+        )
+
+        _, uuid_to_attachment = await uploader._request_upload_urls(attachments, session)
+
+        assert len(session.posts) == 1
+        files = session.last_post.kwargs["json"]["files"]
+        assert files.keys() == uuid_to_attachment.keys()
+        assert sorted(entry["filename"] for entry in files.values()) == sorted(
+            attachment.filename for attachment in attachments
+        )
+
+    @pytest.mark.asyncio
+    async def test_request_upload_urls_rejects_non_dict_response(self, uploader, test_attachment):
         """Test malformed upload URL responses raise UpstreamSchemaError."""
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         session = FakeHttpTransport(FakeHttpResponse(ok=True, json_data=[]))
 
@@ -349,9 +471,9 @@ class TestUploadManagerQuotaHandling:
             await uploader._request_upload_urls(attachments, session)
 
     @pytest.mark.asyncio
-    async def test_request_upload_urls_rejects_non_dict_results(self, uploader):
+    async def test_request_upload_urls_rejects_non_dict_results(self, uploader, test_attachment):
         """Test malformed upload results payload raises UpstreamSchemaError."""
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         session = FakeHttpTransport(FakeHttpResponse(ok=True, json_data={"results": []}))
 
@@ -363,7 +485,7 @@ class TestUploadManagerCookies:
     """Tests for cookie passing in upload manager."""
 
     @pytest.mark.asyncio
-    async def test_cookies_passed_to_api_request(self):
+    async def test_cookies_passed_to_api_request(self, test_attachment):
         """Test that cookies are sent with the presigned URL request."""
         cookies = {
             "cf_clearance": "test-clearance",
@@ -371,7 +493,7 @@ class TestUploadManagerCookies:
             "pplx.session-id": "test-session",
         }
         uploader = AttachmentUploader(token="test-token", cookies=cookies)
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         api_response = {
             "results": {
@@ -392,11 +514,11 @@ class TestUploadManagerCookies:
         assert dict(session.last_post.kwargs["cookies"]) == cookies
 
     @pytest.mark.asyncio
-    async def test_csrf_token_in_headers(self):
+    async def test_csrf_token_in_headers(self, test_attachment):
         """Test that X-CSRFToken header is set from cookies."""
         cookies = {"csrftoken": "test-csrf-value"}
         uploader = AttachmentUploader(token="test-token", cookies=cookies)
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         api_response = {
             "results": {
@@ -417,10 +539,10 @@ class TestUploadManagerCookies:
         assert headers["X-CSRFToken"] == "test-csrf-value"
 
     @pytest.mark.asyncio
-    async def test_origin_and_referer_headers_sent(self):
+    async def test_origin_and_referer_headers_sent(self, test_attachment):
         """Test that Origin and Referer headers are included in requests."""
         uploader = AttachmentUploader(token="test-token")
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         api_response = {
             "results": {
@@ -442,10 +564,10 @@ class TestUploadManagerCookies:
         assert headers["Referer"] == "https://www.perplexity.ai/"
 
     @pytest.mark.asyncio
-    async def test_no_cookies_sends_empty_dict(self):
+    async def test_no_cookies_sends_empty_dict(self, test_attachment):
         """Test that no cookies results in empty dict (not None)."""
         uploader = AttachmentUploader(token="test-token")
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         api_response = {
             "results": {
@@ -468,15 +590,10 @@ class TestUploadManagerCookies:
 class TestUploadManagerLogging:
     """Tests for logging and error messages in upload manager."""
 
-    @pytest.fixture
-    def uploader(self):
-        """Create an AttachmentUploader instance."""
-        return AttachmentUploader(token="test-token")
-
     @pytest.mark.asyncio
-    async def test_auth_error_logging_message(self, uploader, caplog):
+    async def test_auth_error_logging_message(self, uploader, caplog, test_attachment):
         """Test that helpful error message is logged on auth failure."""
-        attachments = [_make_attachment(body=b"content")]
+        attachments = [test_attachment]
 
         response = FakeHttpResponse(
             ok=False,
@@ -499,14 +616,14 @@ class TestUploadManagerLogging:
             assert any("pxcli auth login" in record.message for record in error_logs)
 
     @pytest.mark.asyncio
-    async def test_invalid_fields_type_raises_upstream_error(self, uploader, caplog):
+    async def test_invalid_fields_type_raises_upstream_error(
+        self, uploader, caplog, test_attachment, s3_client
+    ):
         """A non-mapping fields type raises UpstreamSchemaError, never warns."""
-        test_attachment = _make_attachment(body=b"Test file content")
-
         upload_data = {
             "fields": ["unexpected", "list"],
             "s3_object_url": _S3_OBJECT_URL,
         }
 
         with pytest.raises(UpstreamSchemaError, match="fields"):
-            await uploader._upload_to_s3(test_attachment, upload_data, _make_s3_client())
+            await uploader._upload_to_s3(test_attachment, upload_data, s3_client)
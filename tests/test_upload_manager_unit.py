@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+import base64
+from types import SimpleNamespace
 
 import pytest
 
 from perplexity_cli.attachments.upload_manager import (
+    _decoded_size,
     _diagnose_upload_entry_error,
     _extract_error_response_text,
     _has_usable_fields,
@@ -45,13 +47,22 @@ class TestExtractErrorResponseText:
         assert len(result) <= 500
 
     def test_handles_attribute_error(self) -> None:
-        # A spec-restricted Mock with no attributes exercises the
-        # AttributeError fallback path that FakeHttpResponse cannot model.
-        response = Mock(spec_set=[])
+        # An attribute-less namespace exercises the AttributeError fallback
+        # path that FakeHttpResponse cannot model.
+        response = SimpleNamespace()
         result = _extract_error_response_text(response)
         assert result == ""
 
 
+class TestDecodedSize:
+    """Tests for _decoded_size()."""
+
+    @pytest.mark.parametrize("length", range(8))
+    def test_matches_decoded_length(self, length: int) -> None:
+        encoded = base64.b64encode(b"x" * length).decode("ascii")
+        assert _decoded_size(encoded) == length
+
+
 class TestDiagnoseUploadEntryError:
     """Tests for _diagnose_upload_entry_error()."""
 
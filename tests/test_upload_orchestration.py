@@ -86,9 +86,12 @@ def _block_external_network(monkeypatch: pytest.MonkeyPatch) -> None:
 @pytest.fixture
 def uploader(monkeypatch: pytest.MonkeyPatch) -> AttachmentUploader:
     """Create an uploader whose network session is a fake transport."""
-    uploader = AttachmentUploader(token="test-token")
-    monkeypatch.setattr(uploader, "_create_async_session", lambda timeout=None: FakeHttpTransport())
-    return uploader
+    monkeypatch.setattr(
+        AttachmentUploader,
+        "_create_async_session",
+        staticmethod(lambda timeout=None: FakeHttpTransport()),
+    )
+    return AttachmentUploader(token="test-token")
 
 
 @pytest.fixture